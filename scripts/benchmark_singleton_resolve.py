@@ -0,0 +1,54 @@
+"""Micro-benchmark for resolving warm singletons.
+
+Usage: PYTHONPATH=src python scripts/benchmark_singleton_resolve.py
+"""
+
+import timeit
+
+from dependency_injection.container import DependencyContainer
+
+NUMBER = 200_000
+REPEAT = 5
+
+
+class Settings:
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+def measure(statement) -> float:
+    """Return the best per-call latency in nanoseconds."""
+    best = min(timeit.repeat(statement, number=NUMBER, repeat=REPEAT))
+    return best / NUMBER * 1e9
+
+
+def main():
+    container = DependencyContainer.get_instance("benchmark")
+    container.register_singleton(Settings)
+    container.register_singleton(ConnectionPool)
+    container.resolve(ConnectionPool)
+
+    instances = container._singleton_instances
+    results = {
+        "dict lookup (baseline)": measure(lambda: instances[ConnectionPool]),
+        "resolve warm singleton": measure(lambda: container.resolve(ConnectionPool)),
+        "resolve warm singleton in scope": measure(
+            lambda: container.resolve(ConnectionPool, scope_name="request")
+        ),
+    }
+
+    container.configure_thread_safety()
+    results["resolve warm singleton (thread-safe)"] = measure(
+        lambda: container.resolve(ConnectionPool)
+    )
+
+    for name, latency in results.items():
+        print(f"{name:<40} {latency:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare two benchmark JSON reports and fail on regressions.
+
+Usage: python scripts/compare_benchmarks.py BASELINE.json CURRENT.json [THRESHOLD]
+
+Benchmarks are matched by their full name and compared on their fastest round,
+which is the least noisy statistic. The exit status is 1 if any benchmark got
+slower than the threshold (default 0.25, i.e. 25%).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+DEFAULT_THRESHOLD = 0.25
+
+
+def load(path: str) -> dict:
+    report = json.loads(Path(path).read_text())
+    return {
+        benchmark["fullname"]: benchmark["stats"]["min"]
+        for benchmark in report["benchmarks"]
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    regressions = []
+
+    for name in sorted(baseline.keys() & current.keys()):
+        ratio = current[name] / baseline[name]
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(
+            f"{name:<90} {baseline[name] * 1e9:12.1f} ns "
+            f"{current[name] * 1e9:12.1f} ns {ratio:6.2f}x {marker}"
+        )
+        if marker:
+            regressions.append(name)
+
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"{name:<90} missing from current report")
+
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        sys.exit(__doc__)
+
+    threshold = float(sys.argv[3]) if len(sys.argv) == 4 else DEFAULT_THRESHOLD
+    regressions = compare(load(sys.argv[1]), load(sys.argv[2]), threshold)
+
+    if regressions:
+        print(
+            f"\n❌ {len(regressions)} benchmark(s) regressed by more than "
+            f"{threshold:.0%}"
+        )
+        sys.exit(1)
+    print("\n✅ No regressions")
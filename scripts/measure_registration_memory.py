@@ -0,0 +1,67 @@
+"""Measure the memory used per registration.
+
+Usage: PYTHONPATH=src python scripts/measure_registration_memory.py
+"""
+
+import gc
+import tracemalloc
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.registration import Registration
+from dependency_injection.scope import Scope
+
+COUNT = 20_000
+
+
+class Plugin:
+    def __init__(self, name: str = ""):
+        self.name = name
+
+
+class Tag:
+    pass
+
+
+def measure(create) -> float:
+    """Return the bytes allocated per call of ``create``, kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [create(index) for index in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects is not part of the registrations
+    return (after - before) / len(kept) - 8
+
+
+def main():
+    classes = [type(f"Plugin{index}", (Plugin,), {}) for index in range(COUNT)]
+
+    results = {
+        "Registration (plain)": measure(
+            lambda index: Registration(classes[index], Plugin, Scope.TRANSIENT)
+        ),
+        "Registration (tags, constructor args)": measure(
+            lambda index: Registration(
+                classes[index],
+                Plugin,
+                Scope.TRANSIENT,
+                tags={Tag},
+                constructor_args={"name": "plugin"},
+            )
+        ),
+    }
+
+    def register(index):
+        container = DependencyContainer.get_instance(f"measure_{index // 1000}")
+        container.register_transient(classes[index], Plugin)
+
+    results["register_transient (registry entry)"] = measure(register)
+    DependencyContainer.clear_instances()
+
+    for name, size in results.items():
+        print(f"{name:<40} {size:8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
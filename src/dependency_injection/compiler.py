@@ -0,0 +1,28 @@
+from typing import Any, Callable, Sequence, Tuple
+
+
+def compile_constructor(
+    implementation: Any, arguments: Sequence[Tuple[str, bool, Any]]
+) -> Callable[[str], Any]:
+    """Generate a ``build(scope_name)`` function calling ``implementation``.
+
+    Each argument is a ``(name, is_resolver, value)`` triple. Resolvers are
+    called with the scope name, other values are passed through unchanged.
+    """
+    namespace = {"implementation": implementation}
+    call_args = []
+
+    for index, (name, is_resolver, value) in enumerate(arguments):
+        symbol = f"_arg{index}"
+        namespace[symbol] = value
+        if is_resolver:
+            call_args.append(f"{name}={symbol}(scope_name)")
+        else:
+            call_args.append(f"{name}={symbol}")
+
+    source = (
+        "def build(scope_name):\n"
+        f"    return implementation({', '.join(call_args)})\n"
+    )
+    exec(source, namespace)
+    return namespace["build"]
@@ -1,12 +1,27 @@
+import asyncio
 import inspect
+import threading
+import time
+import uuid
+import warnings
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from dataclasses import is_dataclass
+from types import MappingProxyType
 
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
+    Tuple,
     TypeVar,
     Type,
     Union,
@@ -17,12 +32,35 @@ from typing import (
 from dependency_injection.tags.all_tagged import AllTagged
 from dependency_injection.tags.any_tagged import AnyTagged
 from dependency_injection.tags.tagged import Tagged
+from dependency_injection.compiler import compile_constructor
+from dependency_injection.instrumentation import Instrumentation, ResolveHook
+from dependency_injection.iterative_resolver import IterativeResolver
+from dependency_injection.lazy import Lazy
+from dependency_injection.provider import Provider
 from dependency_injection.registration import Registration
+from dependency_injection.resolution_plan import (
+    ParameterKind,
+    ParameterPlan,
+    ResolutionPlan,
+)
 from dependency_injection.scope import DEFAULT_SCOPE_NAME, Scope
+from dependency_injection.service_scope import (
+    AsyncServiceScope,
+    ServiceScope,
+    dispose_instances,
+    dispose_instances_async,
+)
+from dependency_injection.tracing import Trace, Tracer
+from dependency_injection.utils.keyed_locks import KeyedLocks
 from dependency_injection.utils.singleton_meta import SingletonMeta
 
 Self = TypeVar("Self", bound="DependencyContainer")
 NoneType = type(None)
+_MISSING = object()
+_NO_TAGS = frozenset()
+_NO_POSTINGS = MappingProxyType({})
+_DEFERRED_ORIGINS = {Lazy: ParameterKind.LAZY, Provider: ParameterKind.PROVIDER}
+_DEFERRED_KINDS = frozenset(_DEFERRED_ORIGINS.values())
 
 
 DEFAULT_CONTAINER_NAME = "default_container"
@@ -34,9 +72,42 @@ class DependencyContainer(metaclass=SingletonMeta):
 
     def __init__(self, name: str):
         self.name = name
+        self._parent = None
+        self._children = weakref.WeakSet()
+        self._overrides = {}
+        self._stale = False
+        self._batch = ContextVar(f"dependency_injection_batch_{name}", default=None)
         self._registrations = {}
+        self._registration_positions = {}
+        self._tag_index = {}
+        self._tag_queries = {}
+        self._tagged_lists = {}
         self._singleton_instances = {}
-        self._scoped_instances = {}
+        self._inherited_singletons = set()
+        self._scoped_instances = OrderedDict()
+        self._scope_limit = None
+        self._scope_lock = threading.Lock()
+        self._active_scopes = {}
+        self._weak_scopes = False
+        self._plans = {}
+        self._factories = {}
+        self._pending_factories = {}
+        self._compiled = False
+        self._frozen = False
+        self._compile_lock = threading.RLock()
+        self._thread_safe = False
+        self._locks = KeyedLocks()
+        self._pending_async = {}
+        self._current_scope_name = ContextVar(
+            f"dependency_injection_scope_{name}", default=None
+        )
+        self._detect_cycles = False
+        self._iterative_resolver = None
+        self._instrumentation = None
+        self._tracer = None
+        self._resolution_path = ContextVar(
+            f"dependency_injection_path_{name}", default=()
+        )
         self._has_resolved = False
 
     @classmethod
@@ -46,6 +117,10 @@ class DependencyContainer(metaclass=SingletonMeta):
         """Override the default container name, which can be string or callable."""
         cls._default_container_name = name_or_callable
 
+        # Forget the cached default containers, subclasses inherit the name
+        for key in [key for key in cls._instances if isinstance(key, type)]:
+            del cls._instances[key]
+
     @classmethod
     def configure_default_scope_name(
         cls, default_scope_name: Union[str, Callable[[], str]]
@@ -62,17 +137,50 @@ class DependencyContainer(metaclass=SingletonMeta):
 
     @classmethod
     def get_instance(cls, name: str = None) -> Self:
+        instances = cls._instances
+
         if name is None:
-            name = (
-                cls._default_container_name()
-                if callable(cls._default_container_name)
-                else cls._default_container_name
-            )
+            # The default container is also kept under the class itself, so
+            # obtaining it doesn't need the name. Callable names can change
+            # between calls and are looked up every time.
+            instance = instances.get(cls)
+            if instance is not None:
+                return instance
+
+            if callable(cls._default_container_name):
+                return cls(cls._default_container_name())
+
+            instance = cls(cls._default_container_name)
+            instances[cls] = instance
+            return instance
 
-        if (cls, name) not in cls._instances:
-            cls._instances[(cls, name)] = cls(name)
+        instance = instances.get((cls, name))
+        if instance is None:
+            instance = cls(name)
+        return instance
 
-        return cls._instances[(cls, name)]
+    def create_child(self, name: str) -> Self:
+        """Create a named container that inherits this container's registrations.
+
+        The child sees every registration of its parent, including ones made
+        later, and its own registrations override them. Singletons registered
+        in the parent are resolved by the parent and shared with the child.
+        The registrations are flattened on first use, so lookups cost the same
+        as in any other container. The child is obtainable via get_instance().
+        """
+        cls = type(self)
+        if (cls, name) in cls._instances:
+            raise ValueError(f"Container '{name}' already exists.")
+
+        child = cls(name)
+        child._parent = self
+        child._stale = True
+        child._thread_safe = self._thread_safe
+        child._compiled = self._compiled
+        child._detect_cycles = self._detect_cycles
+        child._weak_scopes = self._weak_scopes
+        self._children.add(child)
+        return child
 
     def register_transient(
         self,
@@ -113,18 +221,55 @@ class DependencyContainer(metaclass=SingletonMeta):
         tags: Optional[set] = None,
     ) -> None:
         self._validate_registration(dependency)
-        self._registrations[dependency] = Registration(
-            dependency, None, Scope.FACTORY, tags, None, factory, factory_args
+        self._add_registration(
+            Registration(
+                dependency, None, Scope.FACTORY, tags, None, factory, factory_args
+            )
         )
 
     def register_instance(
         self, dependency: Type, instance: Any, tags: Optional[set] = None
     ) -> None:
         self._validate_registration(dependency)
-        self._registrations[dependency] = Registration(
-            dependency, type(instance), Scope.SINGLETON, tags=tags
+        self._add_registration(
+            Registration(dependency, type(instance), Scope.SINGLETON, tags=tags),
+            instance,
         )
-        self._singleton_instances[dependency] = instance
+
+    def register_many(self, registrations: Iterable[Registration]) -> None:
+        """Register many dependencies at once.
+
+        Works like registering them one by one in a batch, see
+        batch_registration().
+        """
+        with self.batch_registration():
+            for registration in registrations:
+                self._validate_registration(registration.dependency)
+                self._add_registration(registration)
+
+    @contextmanager
+    def batch_registration(self) -> Iterator[None]:
+        """Defer the registrations made inside the block until it exits.
+
+        The registrations are then checked and added together, and the caches
+        derived from them are invalidated once, which makes registering large
+        numbers of dependencies cheaper. Duplicate registrations are reported
+        in a single ValueError, in which case none of the batch is registered.
+        Nothing is registered either when the block raises. Nested batches are
+        added with the outermost one. The batch only collects registrations
+        made in the current thread or task; others are registered immediately.
+        """
+        if self._batch.get() is not None:
+            yield
+            return
+
+        batch = []
+        token = self._batch.set(batch)
+        try:
+            yield
+        finally:
+            self._batch.reset(token)
+        self._add_registrations(batch)
 
     def _register(
         self,
@@ -136,90 +281,1247 @@ class DependencyContainer(metaclass=SingletonMeta):
     ) -> None:
         implementation = implementation or dependency
         self._validate_registration(dependency)
-        self._registrations[dependency] = Registration(
-            dependency, implementation, scope, tags, constructor_args
+        self._add_registration(
+            Registration(dependency, implementation, scope, tags, constructor_args)
         )
 
-    def resolve(self, dependency: Type, scope_name: Optional[str] = None) -> Any:
-        self._has_resolved = True
-        scope_name = scope_name or self.get_default_scope_name()
+    def _add_registration(
+        self, registration: Registration, instance: Any = _MISSING
+    ) -> None:
+        batch = self._batch.get()
+        if batch is not None:
+            batch.append((registration, instance))
+            return
 
-        if scope_name not in self._scoped_instances:
-            self._scoped_instances[scope_name] = {}
+        self._insert_registration(registration, instance)
+        self._invalidate_caches()
 
-        registration = self._registrations.get(dependency)
+    def _add_registrations(self, batch: List[Tuple[Registration, Any]]) -> None:
+        if self._frozen:
+            raise ValueError(
+                f"Container '{self.name}' is frozen, dependencies can not be "
+                f"registered."
+            )
+
+        registered = (
+            self._overrides if self._parent is not None else self._registrations
+        )
+        seen = set()
+        duplicates = {}
+        for registration, _ in batch:
+            dependency = registration.dependency
+            if dependency in registered or dependency in seen:
+                duplicates[dependency] = None
+            seen.add(dependency)
+
+        if duplicates:
+            raise ValueError(
+                f"Dependencies {', '.join(map(str, duplicates))} "
+                f"are already registered."
+            )
+
+        for registration, instance in batch:
+            self._insert_registration(registration, instance)
+        if batch:
+            self._invalidate_caches()
+
+    def _insert_registration(self, registration: Registration, instance: Any) -> None:
+        dependency = registration.dependency
+        if instance is not _MISSING:
+            self._singleton_instances[dependency] = instance
+            self._inherited_singletons.discard(dependency)
+
+        if self._parent is not None:
+            # Merged with the parent's registrations when flattening
+            self._overrides[dependency] = registration
+            return
+
+        self._registration_positions[dependency] = len(self._registrations)
+        self._registrations[dependency] = registration
+        for tag in registration.tags:
+            self._tag_index.setdefault(tag, {})[dependency] = registration
+
+    def _invalidate_caches(self) -> None:
+        """Drop everything derived from the registrations."""
+        if self._frozen:
+            return  # Keeps the registrations it was frozen with
+
+        self._plans.clear()
+        self._factories.clear()
+        self._tag_queries.clear()
+        self._tagged_lists.clear()
+        for dependency in self._inherited_singletons:
+            # May be overridden by now
+            self._singleton_instances.pop(dependency, None)
+        self._inherited_singletons.clear()
+        if self._parent is not None:
+            self._stale = True
+        for child in list(self._children):
+            child._invalidate_caches()
+
+    def _sync_registrations(self) -> None:
+        """Flatten the registrations of a child container if they changed."""
+        if not self._stale:
+            return
+
+        parent = self._parent
+        parent._sync_registrations()
+        registrations = dict(parent._registrations)
+        registrations.update(self._overrides)
+
+        tag_index = {}
+        for registration in registrations.values():
+            for tag in registration.tags:
+                tag_index.setdefault(tag, {})[registration.dependency] = registration
+
+        self._registrations = registrations
+        self._registration_positions = {
+            dependency: position for position, dependency in enumerate(registrations)
+        }
+        self._tag_index = tag_index
+        self._stale = False
+
+    def _find_registration(self, dependency: Type) -> Optional[Registration]:
+        self._sync_registrations()
+        return self._registrations.get(dependency)
+
+    def _find_plan(self, dependency: Type) -> ResolutionPlan:
+        registration = self._find_registration(dependency)
         if not registration:
             raise KeyError(f"Dependency {dependency.__name__} is not registered.")
+        return self._get_plan(registration)
+
+    def _is_inherited_singleton(self, registration: Registration) -> bool:
+        return (
+            self._parent is not None
+            and registration.scope == Scope.SINGLETON
+            and registration.dependency not in self._overrides
+        )
+
+    def _resolve_inherited_singleton(self, dependency: Type) -> Any:
+        return self._cache_inherited_singleton(
+            dependency, self._parent.resolve(dependency)
+        )
+
+    def _cache_inherited_singleton(self, dependency: Type, instance: Any) -> Any:
+        # Cached by reference, so later resolves take the fast path
+        self._inherited_singletons.add(dependency)
+        self._singleton_instances[dependency] = instance
+        return instance
+
+    def freeze(self) -> None:
+        """Validate the container and make its registrations immutable.
+
+        Everything resolving derives from the registrations is computed up
+        front: the resolution plan of every registration, the matches of every
+        tagged list parameter and, in compiled containers, every factory. As
+        nothing can invalidate these anymore, later registrations are rejected
+        with a ValueError. A frozen child container keeps the registrations of
+        its parent as they were when it was frozen.
+        """
+        self.validate()
+        if self._compiled:
+            self.compile()
+        for plan in list(self._plans.values()):
+            for parameter in plan.parameters:
+                if parameter.kind is ParameterKind.TAGGED_LIST:
+                    self._match_registrations(parameter.tags, parameter.match_all_tags)
+        self._frozen = True
+
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    def compile(self) -> None:
+        """Generate a specialised factory function for every registration.
+
+        Call this once registration is finished. Compiled factories call the
+        constructors directly, with resolvers for each parameter bound up
+        front. Registrations added afterwards are compiled on first resolve.
+        """
+        self._compiled = True
+        self._sync_registrations()
+        for dependency in list(self._registrations):
+            self._get_factory(dependency)
+
+    def validate(self) -> None:
+        """Check that every registration can be resolved.
+
+        Builds and caches the resolution plan of each registration, checking
+        its constructor arguments and that each constructor parameter can be
+        satisfied. All problems are reported together in one ValueError.
+        """
+        errors = []
+        self._sync_registrations()
+
+        for registration in list(self._registrations.values()):
+            if registration.dependency in self._singleton_instances:
+                continue  # Instances need no construction
+            if self._is_inherited_singleton(registration):
+                continue  # Constructed, and validated, by the parent
+
+            try:
+                plan = self._get_plan(registration)
+            except (TypeError, ValueError) as e:
+                errors.append(str(e))
+                continue
+
+            for parameter in plan.parameters:
+                if parameter.kind is ParameterKind.TAGGED_LIST:
+                    self._match_registrations(parameter.tags, parameter.match_all_tags)
+                elif (
+                    (
+                        parameter.kind is ParameterKind.DEPENDENCY
+                        or parameter.kind in _DEFERRED_KINDS
+                    )
+                    and not parameter.has_default
+                    and parameter.target not in self._registrations
+                ):
+                    errors.append(
+                        str(
+                            self._unresolvable_error(
+                                parameter, registration.implementation
+                            )
+                        )
+                    )
+
+        for cycle in self._find_cycles():
+            errors.append(
+                f"Circular dependency detected: {self._describe_path(cycle)}."
+            )
+
+        if errors:
+            raise ValueError(
+                f"Container '{self.name}' has invalid registrations:\n- "
+                + "\n- ".join(errors)
+            )
+
+    def _find_cycles(self) -> List[List[Type]]:
+        graph = {
+            dependency: self._plan_dependencies(plan)
+            for dependency, plan in self._plans.items()
+            if dependency not in self._singleton_instances
+        }
+        visiting, visited = set(), set()
+        cycles = []
+
+        # Iterative depth-first search, as the graph may be arbitrarily deep
+        for root in graph:
+            if root in visited:
+                continue
+            path = [root]
+            stack = [iter(graph[root])]
+            visiting.add(root)
+            while stack:
+                for child in stack[-1]:
+                    if child in visiting:
+                        start = path.index(child)
+                        cycles.append(path[start:] + [child])
+                    elif child not in visited:
+                        visiting.add(child)
+                        path.append(child)
+                        stack.append(iter(graph.get(child, ())))
+                        break
+                else:
+                    node = path.pop()
+                    stack.pop()
+                    visiting.discard(node)
+                    visited.add(node)
+
+        return cycles
+
+    def _plan_dependencies(self, plan: ResolutionPlan) -> List[Type]:
+        """Return the registered dependencies constructing a plan resolves."""
+        dependencies = []
+        for parameter in plan.parameters:
+            if parameter.kind is ParameterKind.TAGGED_LIST:
+                dependencies.extend(
+                    r.dependency
+                    for r in self._match_registrations(
+                        parameter.tags, parameter.match_all_tags
+                    )
+                )
+            elif (
+                parameter.kind is not ParameterKind.ARGUMENT
+                and parameter.kind not in _DEFERRED_KINDS
+                and parameter.target in self._registrations
+            ):
+                # Deferred parameters resolve after construction, never in a cycle
+                dependencies.append(parameter.target)
+        return dependencies
+
+    def build(self, instantiate_singletons: bool = False) -> None:
+        """Validate the container and pre-compute everything resolving needs.
+
+        Call this at startup, once registration is finished, so that
+        misconfiguration fails early and the first resolve runs at steady-state
+        speed. Singletons are optionally created up front as well.
+        """
+        self.validate()
+
+        if self._compiled:
+            self.compile()
+
+        if instantiate_singletons:
+            for registration in list(self._registrations.values()):
+                if registration.scope == Scope.SINGLETON:
+                    self.resolve(registration.dependency)
+
+    def configure_cycle_detection(self, enabled: bool = True) -> None:
+        """Detect circular dependencies while resolving.
+
+        Intended for debugging: each resolve records the path of dependencies
+        being constructed and raises a ValueError showing the cycle, instead of
+        recursing until a RecursionError. Compiled factories are bypassed while
+        enabled. validate() detects cycles regardless of this setting.
+        """
+        self._detect_cycles = enabled
+
+    def configure_iterative_resolution(self, enabled: bool = True) -> None:
+        """Resolve with an explicit work stack instead of recursion.
+
+        The iterative resolver produces the same instances as the default one,
+        but avoids several Python frames per level of the dependency graph, so
+        graph depth is only limited by memory. It always reports circular
+        dependencies. Compiled factories are bypassed while enabled.
+        """
+        self._iterative_resolver = IterativeResolver(self) if enabled else None
+
+    def configure_instrumentation(self, enabled: bool = True) -> None:
+        """Record per-registration resolve statistics and call resolve hooks.
+
+        While enabled, every resolve of a registered dependency, including the
+        nested resolves of constructor parameters, is counted as a hit or as a
+        construction. Compiled factories are bypassed, and with iterative
+        resolution only the requested dependencies are recorded. Disabling
+        drops the statistics and hooks, and resolve runs at full speed again.
+        """
+        if not enabled:
+            self._instrumentation = None
+        elif self._instrumentation is None:
+            self._instrumentation = Instrumentation()
+        self._observe_resolves()
+
+    def configure_tracing(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        max_traces: int = 100,
+        on_trace: Optional[Callable[[Trace], None]] = None,
+    ) -> None:
+        """Record the tree of dependencies resolved for each request.
+
+        A request is a resolve made from outside the container, and only the
+        given fraction of requests is traced. Requests that are not sampled
+        are resolved as if tracing were off, by compiled factories included.
+        The most recent ``max_traces`` traces are returned by get_traces(), and
+        each finished trace is passed to ``on_trace`` when given.
+        """
+        self._tracer = (
+            Tracer(self.name, sample_rate, max_traces, on_trace) if enabled else None
+        )
+        self._observe_resolves()
 
-        constructor_args = registration.constructor_args or {}
-        self._validate_constructor_args(constructor_args, registration.implementation)
+    def _observe_resolves(self) -> None:
+        if self._instrumentation is None and self._tracer is None:
+            self.__dict__.pop("resolve", None)
+            self.__dict__.pop("resolve_async", None)
+            return
 
-        return self._resolve_by_scope(registration, scope_name)
+        # Shadow the methods on the instance, so disabled costs nothing
+        self.resolve = self._resolve_observed
+        self.resolve_async = self._resolve_async_observed
 
-    def _resolve_by_scope(
-        self, registration: Registration, scope_name: Optional[str] = None
+    def get_traces(self) -> List[Trace]:
+        """Return the most recent traces, oldest first."""
+        if self._tracer is None:
+            raise ValueError(f"Tracing of container '{self.name}' is off.")
+        return self._tracer.get_traces()
+
+    def add_before_resolve_hook(self, hook: ResolveHook) -> None:
+        """Call ``hook(registration, scope_name, cache_hit)`` before resolves.
+
+        Enables instrumentation if needed.
+        """
+        self.configure_instrumentation()
+        self._instrumentation.before_resolve_hooks.append(hook)
+
+    def add_after_resolve_hook(self, hook: ResolveHook) -> None:
+        """Call ``hook(registration, scope_name, cache_hit)`` after resolves.
+
+        Enables instrumentation if needed.
+        """
+        self.configure_instrumentation()
+        self._instrumentation.after_resolve_hooks.append(hook)
+
+    def get_instrumentation_stats(self) -> Dict[str, Any]:
+        """Return the recorded resolve statistics as a plain dict.
+
+        Registrations are keyed by the qualified name of their dependency, with
+        their hits, constructions, cumulative construction time in seconds and
+        hit ratio. Overall hit ratios of singleton and scoped lookups are
+        included as well.
+        """
+        if self._instrumentation is None:
+            raise ValueError(f"Instrumentation of container '{self.name}' is off.")
+        return self._instrumentation.as_dict()
+
+    def reset_instrumentation_stats(self) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation.reset()
+
+    def configure_thread_safety(self, enabled: bool = True) -> None:
+        """Guard singleton and scoped instantiation against concurrent resolves.
+
+        Instances are created with double-checked locking, using one re-entrant
+        lock per dependency, so unrelated dependencies never wait for each
+        other. Nested resolves taken by the same thread re-enter freely. As
+        locks are taken in dependency order, an acyclic graph cannot deadlock.
+        """
+        self._thread_safe = enabled
+
+    def create_scope(self, name: Optional[str] = None) -> ServiceScope:
+        """Create a scope that disposes its scoped instances when closed.
+
+        Use the returned scope as a context manager. A unique name is generated
+        when no name is given.
+        """
+        return ServiceScope(self, name or f"scope_{uuid.uuid4().hex}")
+
+    def get_current_scope_name(self) -> str:
+        """Return the name of the active scope, or the default scope name.
+
+        A scope is active inside its ``with`` (or ``async with``) block. The
+        active scope is tracked per thread and per asyncio task.
+        """
+        return self._current_scope_name.get() or self.get_default_scope_name()
+
+    def _activate_scope(self, scope_name: str) -> Token:
+        # Counted, as a scope may be entered by several threads or tasks
+        with self._scope_lock:
+            self._active_scopes[scope_name] = self._active_scopes.get(scope_name, 0) + 1
+        return self._current_scope_name.set(scope_name)
+
+    def _deactivate_scope(self, scope_name: str, token: Token) -> None:
+        self._current_scope_name.reset(token)
+        with self._scope_lock:
+            count = self._active_scopes.pop(scope_name) - 1
+            if count:
+                self._active_scopes[scope_name] = count
+
+    def dispose_scope(self, scope_name: str) -> None:
+        """Drop the instances of a scope, closing them in reverse order."""
+        instances = self._scoped_instances.pop(scope_name, None)
+        if instances:
+            dispose_instances(instances.values())
+
+    def configure_scope_limit(self, max_scopes: Optional[int]) -> None:
+        """Bound the number of live scopes.
+
+        When more scopes are open than allowed, the least recently used scope
+        is disposed as if it had been closed. Scopes entered with ``with`` (or
+        ``async with``) are never evicted, they are disposed when their block
+        exits. Errors closing evicted instances are reported as a
+        RuntimeWarning. Pass ``None`` to remove the limit.
+        """
+        if max_scopes is not None and max_scopes < 1:
+            raise ValueError("The scope limit must be at least 1.")
+        self._scope_limit = max_scopes
+        self._evict_scopes()
+
+    def configure_weak_scopes(self, enabled: bool = True) -> None:
+        """Hold scoped instances by weak reference.
+
+        A scoped instance is then only shared while something else references
+        it, and is collected as soon as nothing does, without disposing its
+        scope. Collected instances are not closed, and resolving again creates
+        a new instance. Scoped implementations must support weak references.
+        The policy applies to scopes opened after configuring it.
+        """
+        self._weak_scopes = enabled
+
+    def _open_scope(self, scope_name: str) -> Dict[Type, Any]:
+        instances = self._scoped_instances.setdefault(
+            scope_name, weakref.WeakValueDictionary() if self._weak_scopes else {}
+        )
+        if (
+            self._scope_limit is not None
+            and len(self._scoped_instances) > self._scope_limit
+        ):
+            self._evict_scopes(keep=scope_name)
+        return instances
+
+    def _enter_scope(self, scope_name: Optional[str]) -> str:
+        """Return the name of the scope to resolve in, opening it if needed.
+
+        Without a name, the current scope is used. With a scope limit, the
+        scope becomes the most recently used one.
+        """
+        self._has_resolved = True
+        scope_name = (
+            scope_name
+            or self._current_scope_name.get()
+            or self.get_default_scope_name()
+        )
+
+        if scope_name not in self._scoped_instances:
+            self._open_scope(scope_name)
+        elif self._scope_limit is not None:
+            try:
+                self._scoped_instances.move_to_end(scope_name)
+            except KeyError:
+                # Evicted by another thread meanwhile
+                self._open_scope(scope_name)
+        return scope_name
+
+    def _get_scope(self, scope_name: str) -> Dict[Type, Any]:
+        instances = self._scoped_instances.get(scope_name)
+        if instances is None:
+            # Evicted by another thread since the scope was entered
+            instances = self._open_scope(scope_name)
+        return instances
+
+    def _evict_scopes(self, keep: Optional[str] = None) -> None:
+        """Dispose of the least recently used scopes above the scope limit.
+
+        Entered scopes and the scope named ``keep`` are skipped. Eviction
+        happens on behalf of whichever call opened a scope, so errors closing
+        the evicted instances are reported as warnings instead of raised.
+        """
+        scoped_instances = self._scoped_instances
+        evicted = []
+
+        with self._scope_lock:
+            if self._scope_limit is None:
+                return
+            excess = len(scoped_instances) - self._scope_limit
+            if excess <= 0:
+                return
+
+            # The oldest scopes, enough of them to skip every one to keep
+            skipped = self._active_scopes
+            while True:
+                try:
+                    oldest = list(islice(scoped_instances, excess + len(skipped) + 1))
+                    break
+                except RuntimeError:
+                    continue  # Another thread opened or used a scope meanwhile
+            for scope_name in oldest:
+                if len(evicted) == excess:
+                    break
+                if scope_name != keep and scope_name not in skipped:
+                    evicted.append((scope_name, scoped_instances.pop(scope_name, None)))
+
+        for scope_name, instances in evicted:
+            if not instances:
+                continue
+            try:
+                dispose_instances(instances.values())
+            except Exception as e:
+                warnings.warn(
+                    f"Disposing evicted scope '{scope_name}' failed: {e!r}",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
+    def resolve(self, dependency: Type, scope_name: Optional[str] = None) -> Any:
+        # Fast path: already materialised singletons need no scope or locking
+        instance = self._singleton_instances.get(dependency, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        if self._iterative_resolver is not None:
+            return self._iterative_resolver.resolve(dependency, scope_name)
+
+        scope_name = self._enter_scope(scope_name)
+
+        if (
+            self._compiled
+            and not self._detect_cycles
+            and self._instrumentation is None
+            and (self._tracer is None or not self._tracer.is_active())
+        ):
+            factory = self._factories.get(dependency)
+            if factory is None:
+                if not self._find_registration(dependency):
+                    raise KeyError(
+                        f"Dependency {dependency.__name__} is not registered."
+                    )
+                factory = self._get_factory(dependency)
+            return factory(scope_name)
+
+        plan = self._plans.get(dependency) or self._find_plan(dependency)
+
+        if self._detect_cycles:
+            return self._resolve_tracked(plan, scope_name)
+
+        return self._resolve_by_scope(plan, scope_name)
+
+    def _resolve_observed(
+        self, dependency: Type, scope_name: Optional[str] = None
+    ) -> Any:
+        tracer = self._tracer
+        if tracer is not None and not tracer.is_tracing():
+            # Untraced requests skip the bookkeeping, unless instrumented
+            token = tracer.skip()
+            try:
+                if self._instrumentation is None:
+                    return type(self).resolve(self, dependency, scope_name)
+                return self._resolve_instrumented(dependency, scope_name, None)
+            finally:
+                if token is not None:
+                    tracer.reset(token)
+
+        return self._resolve_instrumented(dependency, scope_name, tracer)
+
+    def _resolve_instrumented(
+        self, dependency: Type, scope_name: Optional[str], tracer: Optional[Tracer]
+    ) -> Any:
+        registration = self._find_registration(dependency)
+        if registration is None:
+            return type(self).resolve(self, dependency, scope_name)
+
+        scope_name = scope_name or self.get_current_scope_name()
+        cache_hit = self._is_cached(registration, scope_name)
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            instrumentation.before_resolve(registration, scope_name, cache_hit)
+        token = tracer.enter(registration, scope_name, cache_hit) if tracer else None
+
+        start = time.perf_counter()
+        try:
+            instance = type(self).resolve(self, dependency, scope_name)
+        finally:
+            if token is not None:
+                tracer.exit(token)
+        elapsed = time.perf_counter() - start
+
+        if instrumentation is not None:
+            instrumentation.after_resolve(registration, scope_name, cache_hit, elapsed)
+        return instance
+
+    async def _resolve_async_observed(
+        self, dependency: Type, scope_name: Optional[str] = None
     ) -> Any:
+        tracer = self._tracer
+        if tracer is not None and not tracer.is_tracing():
+            token = tracer.skip()
+            try:
+                if self._instrumentation is None:
+                    return await type(self).resolve_async(self, dependency, scope_name)
+                return await self._resolve_async_instrumented(
+                    dependency, scope_name, None
+                )
+            finally:
+                if token is not None:
+                    tracer.reset(token)
+
+        return await self._resolve_async_instrumented(dependency, scope_name, tracer)
+
+    async def _resolve_async_instrumented(
+        self, dependency: Type, scope_name: Optional[str], tracer: Optional[Tracer]
+    ) -> Any:
+        registration = self._find_registration(dependency)
+        if registration is None:
+            return await type(self).resolve_async(self, dependency, scope_name)
+
+        scope_name = scope_name or self.get_current_scope_name()
+        cache_hit = self._is_cached(registration, scope_name)
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            instrumentation.before_resolve(registration, scope_name, cache_hit)
+        token = tracer.enter(registration, scope_name, cache_hit) if tracer else None
+
+        start = time.perf_counter()
+        try:
+            instance = await type(self).resolve_async(self, dependency, scope_name)
+        finally:
+            if token is not None:
+                tracer.exit(token)
+        elapsed = time.perf_counter() - start
+
+        if instrumentation is not None:
+            instrumentation.after_resolve(registration, scope_name, cache_hit, elapsed)
+        return instance
+
+    def _is_cached(self, registration: Registration, scope_name: str) -> bool:
+        if registration.scope == Scope.SINGLETON:
+            return registration.dependency in self._singleton_instances
+        if registration.scope == Scope.SCOPED:
+            instances = self._scoped_instances.get(scope_name)
+            return instances is not None and registration.dependency in instances
+        return False
+
+    def _resolve_tracked(self, plan: ResolutionPlan, scope_name: str) -> Any:
+        token = self._enter_resolution(plan.registration.dependency)
+        try:
+            return self._resolve_by_scope(plan, scope_name)
+        finally:
+            self._resolution_path.reset(token)
+
+    def _enter_resolution(self, dependency: Type) -> Token:
+        path = self._resolution_path.get()
+        if dependency in path:
+            start = path.index(dependency)
+            cycle = path[start:] + (dependency,)
+            raise ValueError(
+                f"Circular dependency detected: {self._describe_path(cycle)}."
+            )
+        return self._resolution_path.set(path + (dependency,))
+
+    def _describe_path(self, path: Iterable[Type]) -> str:
+        return " -> ".join(getattr(d, "__name__", str(d)) for d in path)
+
+    def _get_plan(self, registration: Registration) -> ResolutionPlan:
+        plan = self._plans.get(registration.dependency)
+        if plan is None:
+            plan = self._build_plan(registration)
+            self._plans[registration.dependency] = plan
+        return plan
+
+    def _build_plan(self, registration: Registration) -> ResolutionPlan:
+        constructor_args = registration.constructor_args
+        implementation = registration.implementation
+
+        if registration.scope == Scope.FACTORY:
+            return ResolutionPlan(registration, (), False, constructor_args)
+
+        constructor = inspect.signature(implementation.__init__).parameters
+        self._validate_constructor_args(constructor_args, implementation, constructor)
+
+        if is_dataclass(implementation):
+            # Do not inject into dataclasses
+            return ResolutionPlan(registration, (), False, constructor_args)
+
+        parameters = tuple(
+            self._build_parameter_plan(param, constructor_args)
+            for name, param in constructor.items()
+            if name != "self"
+            and param.kind
+            not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        )
+        return ResolutionPlan(registration, parameters, True, constructor_args)
+
+    def _build_parameter_plan(
+        self, param: inspect.Parameter, constructor_args: Dict[str, Any]
+    ) -> ParameterPlan:
+        name = param.name
+        annotation = param.annotation
+        has_default = self._should_use_default(param)
+
+        if name in constructor_args:
+            return ParameterPlan(
+                name,
+                annotation,
+                ParameterKind.ARGUMENT,
+                has_default,
+                value=constructor_args[name],
+            )
+
+        if get_origin(annotation) is list:
+            tags, match_all_tags = self._get_list_dependency_tags(annotation)
+            return ParameterPlan(
+                name,
+                annotation,
+                ParameterKind.TAGGED_LIST,
+                has_default,
+                tags=tags,
+                match_all_tags=match_all_tags,
+            )
+
+        if get_origin(annotation) in _DEFERRED_ORIGINS:
+            return ParameterPlan(
+                name,
+                annotation,
+                _DEFERRED_ORIGINS[get_origin(annotation)],
+                has_default,
+                target=get_args(annotation)[0],
+            )
+
+        if self._is_optional_type(annotation):
+            return ParameterPlan(
+                name,
+                annotation,
+                ParameterKind.OPTIONAL,
+                has_default,
+                target=self._unwrap_optional_type(annotation),
+            )
+
+        return ParameterPlan(
+            name, annotation, ParameterKind.DEPENDENCY, has_default, target=annotation
+        )
+
+    def _get_factory(self, dependency: Type) -> Callable[[str], Any]:
+        factory = self._factories.get(dependency)
+        if factory is None:
+            with self._compile_lock:
+                factory = self._factories.get(dependency)
+                if factory is None:
+                    factory = self._compile_factory_once(dependency)
+        return factory
+
+    def _compile_factory_once(self, dependency: Type) -> Callable[[str], Any]:
+        factories = self._factories
+        pending = self._pending_factories
+
+        if dependency in pending:
+            return pending[dependency]
+
+        # Placeholder so that cyclic registrations can bind to each other
+        def forward(scope_name: str) -> Any:
+            return factories[dependency](scope_name)
+
+        pending[dependency] = forward
+        try:
+            factory = self._compile_factory(self._registrations[dependency])
+        except Exception:
+            # Factories compiled meanwhile may be bound to the placeholder
+            factories.clear()
+            raise
+        finally:
+            del pending[dependency]
+        factories[dependency] = factory
+        return factory
+
+    def _compile_factory(self, registration: Registration) -> Callable[[str], Any]:
+        dependency = registration.dependency
         scope = registration.scope
-        scope_name = scope_name or self.get_default_scope_name()
+
+        instance = self._singleton_instances.get(dependency, _MISSING)
+        if instance is not _MISSING:
+            # Instances need no construction, so no plan either
+            return lambda scope_name: instance
+
+        if scope == Scope.FACTORY:
+            factory = registration.factory
+            factory_args = registration.factory_args
+            return lambda scope_name: factory(**factory_args)
+
+        if self._is_inherited_singleton(registration):
+            singleton_instances = self._singleton_instances
+
+            def resolve_inherited(scope_name: str) -> Any:
+                if dependency in singleton_instances:
+                    return singleton_instances[dependency]
+                return self._resolve_inherited_singleton(dependency)
+
+            return resolve_inherited
+
+        construct = self._compile_constructor(self._get_plan(registration))
 
         if scope == Scope.TRANSIENT:
-            return self._inject_dependencies(
-                registration.implementation,
-                constructor_args=registration.constructor_args,
-            )
+            return construct
         elif scope == Scope.SCOPED:
-            instances = self._scoped_instances[scope_name]
-            if registration.dependency not in instances:
-                instances[registration.dependency] = self._inject_dependencies(
-                    registration.implementation,
-                    scope_name,
-                    registration.constructor_args,
+            scoped_instances = self._scoped_instances
+
+            def resolve_scoped(scope_name: str) -> Any:
+                instances = scoped_instances.get(scope_name)
+                if instances is None:
+                    instances = self._open_scope(scope_name)
+                instance = instances.get(dependency, _MISSING)
+                if instance is not _MISSING:
+                    return instance
+                return self._create_once(instances, dependency, construct, scope_name)
+
+            return resolve_scoped
+        elif scope == Scope.SINGLETON:
+            singleton_instances = self._singleton_instances
+
+            def resolve_singleton(scope_name: str) -> Any:
+                if dependency in singleton_instances:
+                    return singleton_instances[dependency]
+                return self._create_once(
+                    singleton_instances, dependency, construct, scope_name
                 )
-            return instances[registration.dependency]
+
+            return resolve_singleton
+
+        raise ValueError(f"Invalid dependency scope: {scope}")
+
+    def _compile_constructor(self, plan: ResolutionPlan) -> Callable[[str], Any]:
+        implementation = plan.registration.implementation
+
+        if not plan.inject:
+            return lambda scope_name: implementation()
+
+        arguments = []
+        for parameter in plan.parameters:
+            if parameter.kind is ParameterKind.ARGUMENT:
+                arguments.append((parameter.name, False, parameter.value))
+            elif parameter.kind is ParameterKind.TAGGED_LIST:
+                arguments.append(
+                    (parameter.name, True, self._compile_list_resolver(parameter))
+                )
+            elif (
+                parameter.kind in _DEFERRED_KINDS
+                and parameter.target in self._registrations
+            ):
+                arguments.append(
+                    (parameter.name, True, self._compile_deferred_resolver(parameter))
+                )
+            elif parameter.target in self._registrations:
+                arguments.append(
+                    (parameter.name, True, self._get_factory(parameter.target))
+                )
+            elif parameter.has_default:
+                continue
+            elif parameter.kind is ParameterKind.OPTIONAL:
+                arguments.append((parameter.name, False, None))
+            else:
+                arguments.append(
+                    (
+                        parameter.name,
+                        True,
+                        self._compile_unresolvable(parameter, implementation),
+                    )
+                )
+
+        return compile_constructor(implementation, arguments)
+
+    def _compile_list_resolver(self, parameter: ParameterPlan) -> Callable[[str], Any]:
+        return lambda scope_name: self._resolve_tagged_list(parameter)
+
+    def _compile_deferred_resolver(
+        self, parameter: ParameterPlan
+    ) -> Callable[[str], Any]:
+        return lambda scope_name: self._resolve_param_value(parameter, scope_name)
+
+    def _compile_unresolvable(
+        self, parameter: ParameterPlan, implementation: Type
+    ) -> Callable[[str], Any]:
+        def unresolvable(scope_name: str) -> Any:
+            raise self._unresolvable_error(parameter, implementation)
+
+        return unresolvable
+
+    def _unresolvable_error(
+        self, parameter: ParameterPlan, implementation: Type
+    ) -> ValueError:
+        return ValueError(
+            f"Cannot resolve dependency for parameter '{parameter.name}' "
+            f"of type '{parameter.annotation}' in class "
+            f"'{implementation.__name__}'."
+        )
+
+    def _resolve_by_scope(self, plan: ResolutionPlan, scope_name: str) -> Any:
+        registration = plan.registration
+        scope = registration.scope
+
+        if scope == Scope.TRANSIENT:
+            return self._inject_dependencies(plan, scope_name)
+        elif scope == Scope.SCOPED:
+            instances = self._get_scope(scope_name)
+            instance = instances.get(registration.dependency, _MISSING)
+            if instance is not _MISSING:
+                return instance
+            return self._create_once(
+                instances,
+                registration.dependency,
+                self._inject_dependencies,
+                plan,
+                scope_name,
+            )
+        elif scope == Scope.SINGLETON:
+            if registration.dependency in self._singleton_instances:
+                return self._singleton_instances[registration.dependency]
+            if self._is_inherited_singleton(registration):
+                return self._resolve_inherited_singleton(registration.dependency)
+            return self._create_once(
+                self._singleton_instances,
+                registration.dependency,
+                self._inject_dependencies,
+                plan,
+                scope_name,
+            )
+        elif scope == Scope.FACTORY:
+            return registration.factory(**registration.factory_args)
+
+        raise ValueError(f"Invalid dependency scope: {scope}")
+
+    def _create_once(
+        self,
+        instances: Dict[Type, Any],
+        dependency: Type,
+        construct: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        # Keep a reference, weak scopes may not hold on to the instance
+        if not self._thread_safe:
+            instance = instances[dependency] = construct(*args)
+            return instance
+
+        with self._locks.get(dependency):
+            instance = instances.get(dependency, _MISSING)
+            if instance is _MISSING:
+                instance = instances[dependency] = construct(*args)
+            return instance
+
+    def _store_once(
+        self, instances: Dict[Type, Any], dependency: Type, instance: Any
+    ) -> Any:
+        """Store an instance unless one was stored meanwhile, and return it."""
+        if not self._thread_safe:
+            return instances.setdefault(dependency, instance)
+
+        with self._locks.get(dependency):
+            return instances.setdefault(dependency, instance)
+
+    async def resolve_async(
+        self, dependency: Type, scope_name: Optional[str] = None
+    ) -> Any:
+        """Resolve a dependency, awaiting factories that return awaitables.
+
+        Concurrent resolves of the same singleton or scoped dependency share a
+        single construction, and the parameters of a constructor are resolved
+        concurrently. Constructed instances that define an asynchronous
+        ``__ainit__()`` are awaited on it before being injected or returned,
+        which resolve() does not do.
+        """
+        instance = self._singleton_instances.get(dependency, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        scope_name = self._enter_scope(scope_name)
+
+        plan = self._plans.get(dependency) or self._find_plan(dependency)
+
+        # Always tracked, as a cycle would otherwise await its own construction
+        token = self._enter_resolution(dependency)
+        try:
+            return await self._resolve_by_scope_async(plan, scope_name)
+        finally:
+            self._resolution_path.reset(token)
+
+    def create_async_scope(self, name: Optional[str] = None) -> AsyncServiceScope:
+        """Create a scope to be used with ``async with``.
+
+        Closing the scope awaits ``aclose()`` (or ``__aexit__``) on its
+        instances in reverse creation order.
+        """
+        return AsyncServiceScope(self, name or f"scope_{uuid.uuid4().hex}")
+
+    async def dispose_scope_async(self, scope_name: str) -> None:
+        """Drop the instances of a scope, awaiting their asynchronous closing."""
+        instances = self._scoped_instances.pop(scope_name, None)
+        if instances:
+            await dispose_instances_async(instances.values())
+
+    async def _resolve_by_scope_async(
+        self, plan: ResolutionPlan, scope_name: str
+    ) -> Any:
+        registration = plan.registration
+        scope = registration.scope
+
+        if scope == Scope.TRANSIENT:
+            return await self._inject_dependencies_async(plan, scope_name)
+        elif scope == Scope.SCOPED:
+            instances = self._get_scope(scope_name)
+            instance = instances.get(registration.dependency, _MISSING)
+            if instance is not _MISSING:
+                return instance
+            return await self._create_once_async(
+                instances, (scope_name, registration.dependency), plan, scope_name
+            )
         elif scope == Scope.SINGLETON:
-            if registration.dependency not in self._singleton_instances:
-                self._singleton_instances[
-                    registration.dependency
-                ] = self._inject_dependencies(
-                    registration.implementation,
-                    constructor_args=registration.constructor_args,
+            if registration.dependency in self._singleton_instances:
+                return self._singleton_instances[registration.dependency]
+            if self._is_inherited_singleton(registration):
+                return self._cache_inherited_singleton(
+                    registration.dependency,
+                    await self._parent.resolve_async(registration.dependency),
                 )
-            return self._singleton_instances[registration.dependency]
+            return await self._create_once_async(
+                self._singleton_instances,
+                (None, registration.dependency),
+                plan,
+                scope_name,
+            )
         elif scope == Scope.FACTORY:
-            return registration.factory(**(registration.factory_args or {}))
+            instance = registration.factory(**registration.factory_args)
+            if inspect.isawaitable(instance):
+                instance = await instance
+            return instance
 
         raise ValueError(f"Invalid dependency scope: {scope}")
 
+    async def _create_once_async(
+        self,
+        instances: Dict[Type, Any],
+        key: Tuple[Optional[str], Type],
+        plan: ResolutionPlan,
+        scope_name: str,
+    ) -> Any:
+        pending = self._pending_async
+        # Futures can only be awaited in the loop they belong to
+        key = (asyncio.get_running_loop(), *key)
+        future = pending.get(key)
+
+        if future is None:
+
+            async def create() -> Any:
+                instance = await self._inject_dependencies_async(plan, scope_name)
+                return self._store_once(
+                    instances, plan.registration.dependency, instance
+                )
+
+            future = asyncio.ensure_future(create())
+            pending[key] = future
+            future.add_done_callback(lambda _: pending.pop(key, None))
+
+        # Cancelling one waiter must not cancel the shared construction
+        return await asyncio.shield(future)
+
+    async def _inject_dependencies_async(
+        self, plan: ResolutionPlan, scope_name: str
+    ) -> Any:
+        implementation = plan.registration.implementation
+
+        if not plan.inject:
+            instance = implementation()
+        else:
+            dependencies = await self._resolve_constructor_args_async(plan, scope_name)
+            instance = implementation(**dependencies)
+
+        # Asynchronous initialisation, which constructors can't await
+        initialise = getattr(instance, "__ainit__", None)
+        if initialise is not None:
+            await initialise()
+        return instance
+
+    async def _resolve_constructor_args_async(
+        self, plan: ResolutionPlan, scope_name: str
+    ) -> Dict[str, Any]:
+        dependencies = {}
+        parameters = []
+
+        for parameter in plan.parameters:
+            if parameter.kind is ParameterKind.ARGUMENT:
+                dependencies[parameter.name] = parameter.value
+            else:
+                parameters.append(parameter)
+
+        if not parameters:
+            values = []
+        elif len(parameters) == 1:
+            try:
+                values = [
+                    await self._resolve_param_value_async(parameters[0], scope_name)
+                ]
+            except KeyError as e:
+                values = [e]
+        else:
+            values = await asyncio.gather(
+                *(
+                    self._resolve_param_value_async(parameter, scope_name)
+                    for parameter in parameters
+                ),
+                return_exceptions=True,
+            )
+
+        for parameter, value in zip(parameters, values):
+            if isinstance(value, KeyError):
+                if parameter.has_default:
+                    continue
+                raise self._unresolvable_error(
+                    parameter, plan.registration.implementation
+                )
+            if isinstance(value, BaseException):
+                raise value
+            dependencies[parameter.name] = value
+
+        return dependencies
+
+    async def _resolve_param_value_async(
+        self, parameter: ParameterPlan, scope_name: str
+    ) -> Any:
+        if parameter.kind is ParameterKind.TAGGED_LIST:
+            return await self.resolve_all_async(
+                tags=parameter.tags, match_all_tags=parameter.match_all_tags
+            )
+
+        if parameter.kind in _DEFERRED_KINDS:
+            return self._resolve_param_value(parameter, scope_name)
+
+        if parameter.kind is ParameterKind.OPTIONAL:
+            try:
+                return await self.resolve_async(parameter.target, scope_name)
+            except KeyError:
+                if parameter.has_default:
+                    raise KeyError  # signal to fallback to default
+                return None
+
+        return await self.resolve_async(parameter.target, scope_name)
+
     def resolve_all(
         self, tags: Optional[set] = None, match_all_tags: bool = False
     ) -> List[Any]:
-        tags = tags or set()
-        resolved_dependencies = []
+        return [
+            self.resolve(registration.dependency)
+            for registration in self._match_registrations(tags, match_all_tags)
+        ]
 
-        for registration in self._registrations.values():
-            if not tags:
-                # If no tags are provided, resolve all dependencies
-                resolved_dependencies.append(self.resolve(registration.dependency))
-            else:
-                if match_all_tags:
-                    # Match dependencies that have all the specified tags
-                    if registration.tags and tags.issubset(registration.tags):
-                        resolved_dependencies.append(
-                            self.resolve(registration.dependency)
-                        )
-                else:
-                    # Match dependencies that have any of the specified tags
-                    if registration.tags and tags.intersection(registration.tags):
-                        resolved_dependencies.append(
-                            self.resolve(registration.dependency)
-                        )
+    async def resolve_all_async(
+        self, tags: Optional[set] = None, match_all_tags: bool = False
+    ) -> List[Any]:
+        """Resolve all matching dependencies, building them concurrently."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self.resolve_async(registration.dependency)
+                    for registration in self._match_registrations(tags, match_all_tags)
+                )
+            )
+        )
+
+    def _match_registrations(
+        self, tags: Optional[set], match_all_tags: bool
+    ) -> Tuple[Registration, ...]:
+        key = (frozenset(tags) if tags else _NO_TAGS, match_all_tags)
+        registrations = self._tag_queries.get(key)
+        if registrations is None:
+            registrations = self._query_tag_index(*key)
+            self._tag_queries[key] = registrations
+        return registrations
+
+    def _query_tag_index(
+        self, tags: frozenset, match_all_tags: bool
+    ) -> Tuple[Registration, ...]:
+        self._sync_registrations()
+
+        if not tags:
+            # If no tags are provided, match all dependencies
+            return tuple(self._registrations.values())
+
+        postings = sorted(
+            (self._tag_index.get(tag, _NO_POSTINGS) for tag in tags), key=len
+        )
+
+        if match_all_tags:
+            # Match dependencies that have all the specified tags
+            smallest, others = postings[0], postings[1:]
+            return tuple(
+                registration
+                for dependency, registration in smallest.items()
+                if all(dependency in posting for posting in others)
+            )
 
-        return resolved_dependencies
+        # Match dependencies that have any of the specified tags
+        if len(postings) == 1:
+            return tuple(postings[0].values())
+
+        matches = {}
+        for posting in postings:
+            matches.update(posting)
+        positions = self._registration_positions
+        return tuple(sorted(matches.values(), key=lambda r: positions[r.dependency]))
 
     def _validate_constructor_args(
-        self, constructor_args: Dict[str, Any], implementation: Type
+        self,
+        constructor_args: Dict[str, Any],
+        implementation: Type,
+        constructor: Optional[Mapping[str, inspect.Parameter]] = None,
     ) -> None:
-        constructor = inspect.signature(implementation.__init__).parameters
+        if constructor is None:
+            constructor = inspect.signature(implementation.__init__).parameters
 
         for arg_name, arg_value in constructor_args.items():
             if arg_name not in constructor:
@@ -250,84 +1552,138 @@ class DependencyContainer(metaclass=SingletonMeta):
                         )
 
     def _validate_registration(self, dependency: Type) -> None:
-        if dependency in self._registrations:
+        if self._frozen:
+            raise ValueError(
+                f"Container '{self.name}' is frozen, "
+                f"dependency {dependency} can not be registered."
+            )
+        if self._batch.get() is not None:
+            # Checked for the whole batch when it's added
+            return
+        registered = (
+            self._overrides if self._parent is not None else self._registrations
+        )
+        if dependency in registered:
             raise ValueError(f"Dependency {dependency} is already registered.")
 
-    def _inject_dependencies(
-        self,
-        implementation: Type,
-        scope_name: Optional[str] = None,
-        constructor_args: Optional[Dict[str, Any]] = None,
-    ) -> Type:
-        scope_name = scope_name or self.get_default_scope_name()
+    def _inject_dependencies(self, plan: ResolutionPlan, scope_name: str) -> Any:
+        implementation = plan.registration.implementation
 
-        if is_dataclass(implementation):
-            return implementation()  # Do not inject into dataclasses
+        if not plan.inject:
+            return implementation()
 
-        dependencies = self._resolve_constructor_args(
-            implementation, scope_name, constructor_args
-        )
+        dependencies = self._resolve_constructor_args(plan, scope_name)
         return implementation(**dependencies)
 
     def _resolve_constructor_args(
-        self,
-        implementation: Type,
-        scope_name: str,
-        constructor_args: Optional[Dict[str, Any]],
+        self, plan: ResolutionPlan, scope_name: str
     ) -> Dict[str, Any]:
-        constructor = inspect.signature(implementation.__init__)
         dependencies = {}
 
-        for name, param in constructor.parameters.items():
-            if name == "self":
-                continue
-            if param.kind in (
-                inspect.Parameter.VAR_POSITIONAL,
-                inspect.Parameter.VAR_KEYWORD,
-            ):
+        for parameter in plan.parameters:
+            if parameter.kind is ParameterKind.ARGUMENT:
+                dependencies[parameter.name] = parameter.value
                 continue
 
-            if constructor_args and name in constructor_args:
-                dependencies[name] = constructor_args[name]
-            else:
-                try:
-                    dependencies[name] = self._resolve_param_value(param, scope_name)
-                except KeyError:
-                    if self._should_use_default(param):
-                        continue
-                    raise ValueError(
-                        f"Cannot resolve dependency for parameter '{name}' "
-                        f"of type '{param.annotation}' in class "
-                        f"'{implementation.__name__}'."
-                    )
+            try:
+                dependencies[parameter.name] = self._resolve_param_value(
+                    parameter, scope_name
+                )
+            except KeyError:
+                if parameter.has_default:
+                    continue
+                raise self._unresolvable_error(
+                    parameter, plan.registration.implementation
+                )
 
         return dependencies
 
-    def _resolve_param_value(self, param: inspect.Parameter, scope_name: str) -> Any:
-        annotation = param.annotation
-
-        if get_origin(annotation) is list:
-            return self._resolve_list_dependency(annotation)
+    def _resolve_param_value(self, parameter: ParameterPlan, scope_name: str) -> Any:
+        if parameter.kind is ParameterKind.TAGGED_LIST:
+            return self._resolve_tagged_list(parameter)
 
-        if self._is_optional_type(annotation):
-            inner = self._unwrap_optional_type(annotation)
+        if parameter.kind is ParameterKind.OPTIONAL:
             try:
-                return self.resolve(inner, scope_name)
+                return self.resolve(parameter.target, scope_name)
             except KeyError:
-                if self._should_use_default(param):
+                if parameter.has_default:
                     raise KeyError  # signal to fallback to default
                 return None
 
-        return self.resolve(annotation, scope_name)
+        if parameter.kind is ParameterKind.LAZY:
+            return Lazy(self._bind_resolver(parameter.target, scope_name))
+
+        if parameter.kind is ParameterKind.PROVIDER:
+            return self._bind_resolver(parameter.target, scope_name)
+
+        return self.resolve(parameter.target, scope_name)
+
+    def _bind_resolver(self, dependency: Type, scope_name: str) -> Callable[[], Any]:
+        """Return a callable resolving a registered dependency in a scope.
+
+        The compiled factory of the dependency is bound directly, skipping the
+        registration lookup of resolve(), unless a mode that must observe every
+        resolve is enabled. With a scope limit, each call still makes the scope
+        the most recently used one. Which of the two is bound is decided here,
+        so enabling cycle detection, instrumentation or tracing afterwards does
+        not apply to resolvers that are already bound.
+        """
+        if not self._find_registration(dependency):
+            raise KeyError(f"Dependency {dependency.__name__} is not registered.")
+
+        if (
+            self._detect_cycles
+            or self._instrumentation is not None
+            or (self._tracer is not None and self._tracer.is_active())
+            or self._iterative_resolver is not None
+        ):
+            resolve = self.resolve
+            return lambda: resolve(dependency, scope_name)
+
+        instance = self._singleton_instances.get(dependency, _MISSING)
+        if instance is not _MISSING:
+            return lambda: instance
+
+        factory = self._get_factory(dependency)
+
+        def resolve_bound() -> Any:
+            if self._scope_limit is not None:
+                # Keeps the scope from being evicted as least recently used
+                self._enter_scope(scope_name)
+            return factory(scope_name)
+
+        return resolve_bound
+
+    def _resolve_tagged_list(self, parameter: ParameterPlan) -> List[Any]:
+        instances = self._tagged_lists.get(parameter.annotation)
+        if instances is not None:
+            return list(instances)
+
+        registrations = self._match_registrations(
+            parameter.tags, parameter.match_all_tags
+        )
+        instances = [self.resolve(r.dependency) for r in registrations]
+        self._memoise_tagged_list(parameter, registrations, instances)
+        return instances
+
+    def _memoise_tagged_list(
+        self,
+        parameter: ParameterPlan,
+        registrations: Tuple[Registration, ...],
+        instances: List[Any],
+    ) -> None:
+        # Lists of singletons never change until the registrations do
+        if all(r.scope == Scope.SINGLETON for r in registrations):
+            self._tagged_lists[parameter.annotation] = tuple(instances)
 
-    def _resolve_list_dependency(self, annotation: Any) -> List[Any]:
+    def _get_list_dependency_tags(self, annotation: Any) -> Tuple[frozenset, bool]:
         inner = get_args(annotation)[0]
         if isinstance(inner, type) and issubclass(inner, Tagged):
-            return self.resolve_all(tags={inner.tag})
+            return frozenset({inner.tag}), False
         elif isinstance(inner, type) and issubclass(inner, AnyTagged):
-            return self.resolve_all(tags=inner.tags, match_all_tags=False)
+            return frozenset(inner.tags), False
         elif isinstance(inner, type) and issubclass(inner, AllTagged):
-            return self.resolve_all(tags=inner.tags, match_all_tags=True)
+            return frozenset(inner.tags), True
         else:
             raise ValueError(f"Unsupported list injection type: {annotation}")
 
@@ -2,50 +2,81 @@ import functools
 import inspect
 from typing import Any, Callable, Optional, TypeVar
 
-from dependency_injection.container import DEFAULT_CONTAINER_NAME, DependencyContainer
+from dependency_injection.container import DependencyContainer
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_VARIADIC_KINDS = (
+    inspect.Parameter.VAR_POSITIONAL,
+    inspect.Parameter.VAR_KEYWORD,
+)
+
 
 def inject(
-    container_name=DEFAULT_CONTAINER_NAME, scope_name: Optional[str] = None
+    container_name: Optional[str] = None, scope_name: Optional[str] = None
 ) -> Callable[[F], F]:
-    def is_instance_method(func: Callable[..., Any]) -> bool:
-        parameters = inspect.signature(func).parameters
+    """Inject missing arguments of a class or static method when it is called.
+
+    Without a container name, the configured default container is used.
+    """
+
+    def is_instance_method(signature: inspect.Signature) -> bool:
+        parameters = signature.parameters
         is_instance_method = (
             len(parameters) > 0 and list(parameters.values())[0].name == "self"
         )
         return is_instance_method
 
     def decorator_inject(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper_inject(*args: Any, **kwargs: Any) -> Any:
-            # Get the parameter names from the function signature
-            sig = inspect.signature(func)
-            parameter_names = [param.name for param in sig.parameters.values()]
-
-            # Iterate over the parameter names and inject dependencies into kwargs
-            for parameter_name in parameter_names:
-                if parameter_name != "cls" and parameter_name not in kwargs:
-                    # get container
-                    container = DependencyContainer.get_instance(container_name)
-                    actual_scope_name = scope_name or container.get_default_scope_name()
-                    # Resolve the dependency based on the parameter name
-                    dependency_type = sig.parameters[parameter_name].annotation
-                    kwargs[parameter_name] = container.resolve(
-                        dependency_type, scope_name=actual_scope_name
-                    )
-
-            # Call the original function with the injected dependencies
-            return func(*args, **kwargs)
+        # Analyse the signature once, when decorating
+        sig = inspect.signature(func)
 
         # Not allowed on instance methods
-        if is_instance_method(func):
+        if is_instance_method(sig):
             raise TypeError(
                 "@inject decorator can only be applied to class "
                 "methods or static methods."
             )
 
+        # (position, name, annotation) of each injectable parameter, where
+        # position is None for parameters that can't be passed positionally
+        injectables = tuple(
+            (
+                position if param.kind in _POSITIONAL_KINDS else None,
+                param.name,
+                param.annotation,
+            )
+            for position, param in enumerate(sig.parameters.values())
+            if param.name != "cls" and param.kind not in _VARIADIC_KINDS
+        )
+
+        @functools.wraps(func)
+        def wrapper_inject(*args: Any, **kwargs: Any) -> Any:
+            container = None
+            actual_scope_name = scope_name
+
+            for position, parameter_name, dependency_type in injectables:
+                # Skip arguments supplied by the caller
+                if parameter_name in kwargs or (
+                    position is not None and position < len(args)
+                ):
+                    continue
+
+                if container is None:
+                    container = DependencyContainer.get_instance(container_name)
+                    actual_scope_name = scope_name or container.get_current_scope_name()
+
+                kwargs[parameter_name] = container.resolve(
+                    dependency_type, scope_name=actual_scope_name
+                )
+
+            # Call the original function with the injected dependencies
+            return func(*args, **kwargs)
+
         return wrapper_inject
 
     return decorator_inject
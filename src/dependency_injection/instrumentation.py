@@ -0,0 +1,102 @@
+import threading
+from typing import Any, Callable, Dict, List, Type
+
+from dependency_injection.registration import Registration
+from dependency_injection.scope import Scope
+
+ResolveHook = Callable[[Registration, str, bool], None]
+
+
+def describe_dependency(dependency: Type) -> str:
+    return f"{dependency.__module__}.{dependency.__qualname__}"
+
+
+class RegistrationStats:
+    """Resolve counters of a single registration."""
+
+    __slots__ = ("registration", "hits", "constructions", "construction_time")
+
+    def __init__(self, registration: Registration):
+        self.registration = registration
+        self.hits = 0
+        self.constructions = 0
+        self.construction_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        resolves = self.hits + self.constructions
+        return {
+            "scope": self.registration.scope.value,
+            "hits": self.hits,
+            "constructions": self.constructions,
+            "construction_time": self.construction_time,
+            "hit_ratio": self.hits / resolves if resolves else 0.0,
+        }
+
+
+class Instrumentation:
+    """Counts resolves per registration and calls the resolve hooks.
+
+    A resolve is a hit when an existing singleton or scoped instance was
+    returned, and a construction otherwise. Construction time is wall time and
+    includes the time spent resolving the dependencies of the instance.
+    """
+
+    def __init__(self):
+        self.before_resolve_hooks: List[ResolveHook] = []
+        self.after_resolve_hooks: List[ResolveHook] = []
+        self._stats: Dict[Type, RegistrationStats] = {}
+        self._lock = threading.Lock()
+
+    def before_resolve(
+        self, registration: Registration, scope_name: str, cache_hit: bool
+    ) -> None:
+        for hook in self.before_resolve_hooks:
+            hook(registration, scope_name, cache_hit)
+
+    def after_resolve(
+        self,
+        registration: Registration,
+        scope_name: str,
+        cache_hit: bool,
+        elapsed: float,
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(registration.dependency)
+            if stats is None or stats.registration is not registration:
+                stats = self._stats[registration.dependency] = RegistrationStats(
+                    registration
+                )
+            if cache_hit:
+                stats.hits += 1
+            else:
+                stats.constructions += 1
+                stats.construction_time += elapsed
+
+        for hook in self.after_resolve_hooks:
+            hook(registration, scope_name, cache_hit)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = list(self._stats.values())
+
+        return {
+            "registrations": {
+                describe_dependency(s.registration.dependency): s.as_dict()
+                for s in stats
+            },
+            "singleton_hit_ratio": self._hit_ratio(stats, Scope.SINGLETON),
+            "scoped_hit_ratio": self._hit_ratio(stats, Scope.SCOPED),
+        }
+
+    @staticmethod
+    def _hit_ratio(stats: List[RegistrationStats], scope: Scope) -> float:
+        hits = resolves = 0
+        for s in stats:
+            if s.registration.scope == scope:
+                hits += s.hits
+                resolves += s.hits + s.constructions
+        return hits / resolves if resolves else 0.0
@@ -0,0 +1,239 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+from dependency_injection.registration import Registration
+from dependency_injection.resolution_plan import (
+    ParameterKind,
+    ParameterPlan,
+    ResolutionPlan,
+)
+from dependency_injection.scope import Scope
+
+if TYPE_CHECKING:
+    from dependency_injection.container import DependencyContainer
+
+_MISSING = object()
+
+
+class _ConstructionFrame:
+    """An instance under construction, waiting for its parameters."""
+
+    __slots__ = ("plan", "scope_name", "instances", "lock", "index", "arguments")
+
+    def __init__(
+        self,
+        plan: ResolutionPlan,
+        scope_name: str,
+        instances: Optional[Dict[Type, Any]],
+        lock: Any,
+    ):
+        self.plan = plan
+        self.scope_name = scope_name
+        self.instances = instances
+        self.lock = lock
+        self.index = 0
+        self.arguments = {}
+
+    def accept(self, value: Any) -> None:
+        self.arguments[self.plan.parameters[self.index].name] = value
+        self.index += 1
+
+
+class _ListFrame:
+    """A tagged list parameter, waiting for its members."""
+
+    __slots__ = ("parameter", "registrations", "members")
+
+    def __init__(
+        self, parameter: ParameterPlan, registrations: Tuple[Registration, ...]
+    ):
+        self.parameter = parameter
+        self.registrations = registrations
+        self.members = []
+
+    def accept(self, value: Any) -> None:
+        self.members.append(value)
+
+
+class IterativeResolver:
+    """Resolves dependency graphs with an explicit work stack.
+
+    Produces the same results as the recursive resolution of the container,
+    but the depth of a dependency graph is only limited by memory. Circular
+    dependencies are always reported, as they would otherwise never finish.
+    """
+
+    def __init__(self, container: "DependencyContainer"):
+        self._container = container
+
+    def resolve(self, dependency: Type, scope_name: Optional[str] = None) -> Any:
+        stack = []
+        in_progress = {}
+        result = self._request(dependency, scope_name, stack, in_progress)
+        error = None
+
+        try:
+            while stack:
+                frame = stack[-1]
+                try:
+                    if error is not None:
+                        self._reject(frame, error)
+                        error = None
+                    elif result is not _MISSING:
+                        frame.accept(result)
+                    result = self._advance(frame, stack, in_progress)
+                except Exception as e:
+                    self._pop(stack, in_progress)
+                    result, error = _MISSING, e
+
+            if error is not None:
+                raise error
+            return result
+        finally:
+            while stack:
+                self._pop(stack, in_progress)
+
+    def _request(
+        self,
+        dependency: Type,
+        scope_name: Optional[str],
+        stack: List[Any],
+        in_progress: Dict[Type, None],
+    ) -> Any:
+        """Return the instance, or push a frame and return _MISSING."""
+        container = self._container
+
+        instance = container._singleton_instances.get(dependency, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        scope_name = container._enter_scope(scope_name)
+        plan = container._find_plan(dependency)
+        registration = plan.registration
+        scope = registration.scope
+        instances = None
+
+        if scope == Scope.FACTORY:
+            return registration.factory(**registration.factory_args)
+        elif scope == Scope.SCOPED:
+            instances = container._get_scope(scope_name)
+            instance = instances.get(dependency, _MISSING)
+            if instance is not _MISSING:
+                return instance
+        elif scope == Scope.SINGLETON:
+            if container._is_inherited_singleton(registration):
+                return container._resolve_inherited_singleton(dependency)
+            instances = container._singleton_instances
+        elif scope != Scope.TRANSIENT:
+            raise ValueError(f"Invalid dependency scope: {scope}")
+
+        if dependency in in_progress:
+            path = list(in_progress)
+            start = path.index(dependency)
+            cycle = path[start:] + [dependency]
+            raise ValueError(
+                f"Circular dependency detected: {container._describe_path(cycle)}."
+            )
+
+        lock = None
+        if instances is not None and container._thread_safe:
+            lock = container._locks.get(dependency)
+            lock.acquire()
+            instance = instances.get(dependency, _MISSING)
+            if instance is not _MISSING:
+                lock.release()
+                return instance
+
+        in_progress[dependency] = None
+        stack.append(_ConstructionFrame(plan, scope_name, instances, lock))
+        return _MISSING
+
+    def _advance(
+        self, frame: Any, stack: List[Any], in_progress: Dict[Type, None]
+    ) -> Any:
+        """Work on the top frame until it needs a child frame or completes."""
+        if isinstance(frame, _ListFrame):
+            return self._advance_list(frame, stack, in_progress)
+
+        container = self._container
+        parameters = frame.plan.parameters
+
+        while frame.index < len(parameters):
+            parameter = parameters[frame.index]
+
+            if parameter.kind is ParameterKind.ARGUMENT:
+                frame.accept(parameter.value)
+                continue
+
+            try:
+                if parameter.kind in (ParameterKind.LAZY, ParameterKind.PROVIDER):
+                    value = container._resolve_param_value(parameter, frame.scope_name)
+                elif parameter.kind is ParameterKind.TAGGED_LIST:
+                    members = container._tagged_lists.get(parameter.annotation)
+                    if members is not None:
+                        value = list(members)
+                    else:
+                        registrations = container._match_registrations(
+                            parameter.tags, parameter.match_all_tags
+                        )
+                        stack.append(_ListFrame(parameter, registrations))
+                        return _MISSING
+                else:
+                    value = self._request(
+                        parameter.target, frame.scope_name, stack, in_progress
+                    )
+                    if value is _MISSING:
+                        return _MISSING
+            except Exception as e:
+                self._reject(frame, e)
+                continue
+
+            frame.accept(value)
+
+        registration = frame.plan.registration
+        instance = registration.implementation(**frame.arguments)
+        if frame.instances is not None:
+            frame.instances[registration.dependency] = instance
+        self._pop(stack, in_progress)
+        return instance
+
+    def _advance_list(
+        self, frame: _ListFrame, stack: List[Any], in_progress: Dict[Type, None]
+    ) -> Any:
+        registrations = frame.registrations
+
+        while len(frame.members) < len(registrations):
+            registration = registrations[len(frame.members)]
+            value = self._request(registration.dependency, None, stack, in_progress)
+            if value is _MISSING:
+                return _MISSING
+            frame.accept(value)
+
+        self._container._memoise_tagged_list(
+            frame.parameter, registrations, frame.members
+        )
+
+        stack.pop()
+        return frame.members
+
+    def _reject(self, frame: Any, error: Exception) -> None:
+        """Handle a failed parameter the way constructor injection does."""
+        if isinstance(frame, _ListFrame) or not isinstance(error, KeyError):
+            raise error
+
+        parameter = frame.plan.parameters[frame.index]
+
+        if parameter.has_default:
+            frame.index += 1
+        elif parameter.kind is ParameterKind.OPTIONAL:
+            frame.accept(None)
+        else:
+            raise self._container._unresolvable_error(
+                parameter, frame.plan.registration.implementation
+            ) from error
+
+    def _pop(self, stack: List[Any], in_progress: Dict[Type, None]) -> None:
+        frame = stack.pop()
+        if isinstance(frame, _ConstructionFrame):
+            del in_progress[frame.plan.registration.dependency]
+            if frame.lock is not None:
+                frame.lock.release()
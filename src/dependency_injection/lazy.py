@@ -0,0 +1,36 @@
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class Lazy(Generic[T]):
+    """Defers resolving a dependency until its value is first used.
+
+    Annotate a constructor parameter with ``Lazy[T]`` to be injected a Lazy
+    instead of ``T``. The first access to ``value`` resolves ``T`` in the scope
+    of the injection, and later accesses return the same instance.
+    """
+
+    __slots__ = ("_resolve", "_value")
+
+    def __init__(self, resolve: Callable[[], T]):
+        self._resolve = resolve
+        self._value = _MISSING
+
+    @property
+    def value(self) -> T:
+        if self._value is _MISSING:
+            self._value = self._resolve()
+            self._resolve = None
+        return self._value
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._value is not _MISSING
+
+    def __repr__(self) -> str:
+        if self._value is _MISSING:
+            return "Lazy(<unresolved>)"
+        return f"Lazy({self._value!r})"
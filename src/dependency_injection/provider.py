@@ -0,0 +1,15 @@
+from typing import Protocol, TypeVar
+
+T = TypeVar("T", covariant=True)
+
+
+class Provider(Protocol[T]):
+    """A zero-argument callable resolving a dependency on each call.
+
+    Annotate a constructor parameter with ``Provider[T]`` to be injected a
+    callable bound to ``T`` and to the scope of the injection. Calling it
+    returns what resolving ``T`` would, without looking up the registration
+    again, which suits code creating many transients in a loop.
+    """
+
+    def __call__(self) -> T: ...
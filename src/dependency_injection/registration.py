@@ -1,9 +1,38 @@
-from typing import Any, Callable, Dict, Optional, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
 
 from dependency_injection.scope import Scope
 
+# Shared by every registration without tags or arguments
+_NO_TAGS = frozenset()
+_NO_ARGS = MappingProxyType({})
+
 
 class Registration:
+    """An immutable record of how a dependency is provided.
+
+    Tags are stored as a frozenset and arguments as read-only mappings, with
+    shared empty defaults, so that large numbers of registrations stay small.
+    """
+
+    __slots__ = (
+        "dependency",
+        "implementation",
+        "scope",
+        "tags",
+        "constructor_args",
+        "factory",
+        "factory_args",
+    )
+
+    dependency: Type
+    implementation: Optional[Type]
+    scope: Scope
+    tags: frozenset
+    constructor_args: Mapping[str, Any]
+    factory: Optional[Callable[..., Any]]
+    factory_args: Mapping[str, Any]
+
     def __init__(
         self,
         dependency: Type,
@@ -14,13 +43,42 @@ class Registration:
         factory: Optional[Callable[[Any], Any]] = None,
         factory_args: Optional[Dict[str, Any]] = None,
     ):
-        self.dependency = dependency
-        self.implementation = implementation
-        self.scope = scope
-        self.tags = tags or set()
-        self.constructor_args = constructor_args or {}
-        self.factory = factory
-        self.factory_args = factory_args or {}
-
-        if not any([self.implementation, self.factory]):
+        if not any([implementation, factory]):
             raise Exception("There must be either an implementation or a factory.")
+
+        initialize = super().__setattr__
+        initialize("dependency", dependency)
+        initialize("implementation", implementation)
+        initialize("scope", scope)
+        initialize("tags", frozenset(tags) if tags else _NO_TAGS)
+        initialize(
+            "constructor_args",
+            MappingProxyType(dict(constructor_args)) if constructor_args else _NO_ARGS,
+        )
+        initialize("factory", factory)
+        initialize(
+            "factory_args",
+            MappingProxyType(dict(factory_args)) if factory_args else _NO_ARGS,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Registration is immutable, cannot set '{name}'.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Registration is immutable, cannot delete '{name}'.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuilt through __init__, as neither slot assignment nor
+        # read-only mappings survive copying and pickling
+        return (
+            type(self),
+            (
+                self.dependency,
+                self.implementation,
+                self.scope,
+                set(self.tags),
+                dict(self.constructor_args),
+                self.factory,
+                dict(self.factory_args),
+            ),
+        )
@@ -0,0 +1,70 @@
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from dependency_injection.registration import Registration
+
+
+class ParameterKind(Enum):
+    ARGUMENT = "argument"
+    DEPENDENCY = "dependency"
+    OPTIONAL = "optional"
+    TAGGED_LIST = "tagged_list"
+    LAZY = "lazy"
+    PROVIDER = "provider"
+
+
+class ParameterPlan:
+    """Describes how a single constructor parameter is satisfied."""
+
+    __slots__ = (
+        "name",
+        "annotation",
+        "kind",
+        "has_default",
+        "target",
+        "tags",
+        "match_all_tags",
+        "value",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        annotation: Any,
+        kind: ParameterKind,
+        has_default: bool = False,
+        target: Any = None,
+        tags: Optional[frozenset] = None,
+        match_all_tags: bool = False,
+        value: Any = None,
+    ):
+        self.name = name
+        self.annotation = annotation
+        self.kind = kind
+        self.has_default = has_default
+        self.target = target
+        self.tags = tags
+        self.match_all_tags = match_all_tags
+        self.value = value
+
+
+class ResolutionPlan:
+    """Pre-computed constructor metadata for a registration.
+
+    A plan is built the first time a registration is resolved and reused until
+    the registrations of the owning container change.
+    """
+
+    __slots__ = ("registration", "parameters", "inject", "constructor_args")
+
+    def __init__(
+        self,
+        registration: Registration,
+        parameters: Tuple[ParameterPlan, ...],
+        inject: bool,
+        constructor_args: Dict[str, Any],
+    ):
+        self.registration = registration
+        self.parameters = parameters
+        self.inject = inject
+        self.constructor_args = constructor_args
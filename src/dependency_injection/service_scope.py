@@ -0,0 +1,106 @@
+from typing import TYPE_CHECKING, Any, Iterable, Type
+
+if TYPE_CHECKING:
+    from dependency_injection.container import DependencyContainer
+
+
+def dispose_instances(instances: Iterable[Any]) -> None:
+    """Close instances in reverse creation order.
+
+    Instances with a ``close()`` method are closed, other context managers are
+    exited. Every instance is disposed even if one fails, after which the first
+    error is re-raised.
+    """
+    error = None
+
+    for instance in reversed(list(instances)):
+        try:
+            close = getattr(instance, "close", None)
+            if callable(close):
+                close()
+            elif hasattr(instance, "__exit__"):
+                instance.__exit__(None, None, None)
+        except Exception as e:
+            error = error or e
+
+    if error is not None:
+        raise error
+
+
+async def dispose_instances_async(instances: Iterable[Any]) -> None:
+    """Close instances in reverse creation order, awaiting asynchronous ones.
+
+    ``aclose()`` and ``__aexit__`` are preferred over their synchronous
+    counterparts. Every instance is disposed even if one fails, after which the
+    first error is re-raised.
+    """
+    error = None
+
+    for instance in reversed(list(instances)):
+        try:
+            aclose = getattr(instance, "aclose", None)
+            if callable(aclose):
+                await aclose()
+            elif hasattr(instance, "__aexit__"):
+                await instance.__aexit__(None, None, None)
+            else:
+                dispose_instances([instance])
+        except Exception as e:
+            error = error or e
+
+    if error is not None:
+        raise error
+
+
+class ServiceScope:
+    """A named scope whose scoped instances are disposed when it is closed.
+
+    While entered, the scope is the container's current scope, so resolves
+    without an explicit scope name use it.
+    """
+
+    def __init__(self, container: "DependencyContainer", name: str):
+        self.container = container
+        self.name = name
+        self._tokens = []
+
+    def resolve(self, dependency: Type) -> Any:
+        return self.container.resolve(dependency, scope_name=self.name)
+
+    def close(self) -> None:
+        self.container.dispose_scope(self.name)
+
+    def __enter__(self) -> "ServiceScope":
+        self._tokens.append(self.container._activate_scope(self.name))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.container._deactivate_scope(self.name, self._tokens.pop())
+        self.close()
+
+
+class AsyncServiceScope:
+    """A named scope for asyncio code, closed with ``async with`` or aclose().
+
+    While entered, the scope is the container's current scope for the running
+    task and the tasks it spawns.
+    """
+
+    def __init__(self, container: "DependencyContainer", name: str):
+        self.container = container
+        self.name = name
+        self._tokens = []
+
+    async def resolve(self, dependency: Type) -> Any:
+        return await self.container.resolve_async(dependency, scope_name=self.name)
+
+    async def aclose(self) -> None:
+        await self.container.dispose_scope_async(self.name)
+
+    async def __aenter__(self) -> "AsyncServiceScope":
+        self._tokens.append(self.container._activate_scope(self.name))
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.container._deactivate_scope(self.name, self._tokens.pop())
+        await self.aclose()
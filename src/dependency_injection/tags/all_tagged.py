@@ -1,9 +1,11 @@
-from typing import Generic, Set, Tuple, Type, TypeVar, Union
+from typing import Dict, FrozenSet, Generic, Set, Tuple, Type, TypeVar, Union
 
 T = TypeVar("T")
 
 
 class AllTagged(Generic[T]):
+    _subscripts: Dict[Tuple[Type, FrozenSet[Type]], Type["AllTagged"]] = {}
+
     def __init__(self, tags: Tuple[Type[T], ...]):
         self.tags: Set[Type[T]] = set(tags)
 
@@ -13,8 +15,15 @@ class AllTagged(Generic[T]):
     ) -> Type["AllTagged"]:
         if not isinstance(item, tuple):
             item = (item,)
-        return type(
-            f'AllTagged_{"_".join([t.__name__ for t in item])}',
-            (cls,),
-            {"tags": set(item)},
-        )
+        key = (cls, frozenset(item))
+        subscript = cls._subscripts.get(key)
+        if subscript is None:
+            subscript = cls._subscripts.setdefault(
+                key,
+                type(
+                    f'AllTagged_{"_".join([t.__name__ for t in item])}',
+                    (cls,),
+                    {"tags": set(item)},
+                ),
+            )
+        return subscript
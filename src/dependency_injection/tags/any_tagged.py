@@ -1,9 +1,11 @@
-from typing import Type, Generic, TypeVar, Tuple, Union, Set
+from typing import Dict, FrozenSet, Type, Generic, TypeVar, Tuple, Union, Set
 
 T = TypeVar("T")
 
 
 class AnyTagged(Generic[T]):
+    _subscripts: Dict[Tuple[Type, FrozenSet[Type]], Type["AnyTagged"]] = {}
+
     def __init__(self, tags: Union[Tuple[Type[T], ...], Type[T]]):
         if not isinstance(tags, tuple):
             tags = (tags,)
@@ -15,8 +17,15 @@ class AnyTagged(Generic[T]):
     ) -> Type["AnyTagged"]:
         if not isinstance(item, tuple):
             item = (item,)
-        return type(
-            f'AnyTagged_{"_".join([t.__name__ for t in item])}',
-            (cls,),
-            {"tags": set(item)},
-        )
+        key = (cls, frozenset(item))
+        subscript = cls._subscripts.get(key)
+        if subscript is None:
+            subscript = cls._subscripts.setdefault(
+                key,
+                type(
+                    f'AnyTagged_{"_".join([t.__name__ for t in item])}',
+                    (cls,),
+                    {"tags": set(item)},
+                ),
+            )
+        return subscript
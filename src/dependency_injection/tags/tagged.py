@@ -1,12 +1,20 @@
-from typing import Type, Generic, TypeVar
+from typing import Dict, Tuple, Type, Generic, TypeVar
 
 T = TypeVar("T")
 
 
 class Tagged(Generic[T]):
+    _subscripts: Dict[Tuple[Type, Type], Type["Tagged"]] = {}
+
     def __init__(self, tag: Type[T]):
         self.tag = tag
 
     @classmethod
     def __class_getitem__(cls, item: Type[T]) -> Type["Tagged"]:
-        return type(f"Tagged_{item.__name__}", (cls,), {"tag": item})
+        key = (cls, item)
+        subscript = cls._subscripts.get(key)
+        if subscript is None:
+            subscript = cls._subscripts.setdefault(
+                key, type(f"Tagged_{item.__name__}", (cls,), {"tag": item})
+            )
+        return subscript
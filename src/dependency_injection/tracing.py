@@ -0,0 +1,161 @@
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, List, Optional
+
+from dependency_injection.instrumentation import describe_dependency
+from dependency_injection.registration import Registration
+
+# Marks a request that was not sampled, so its nested resolves are skipped too
+_UNSAMPLED = object()
+
+
+class TraceNode:
+    """A single resolve within a trace, with the resolves it caused."""
+
+    __slots__ = (
+        "dependency",
+        "scope",
+        "scope_name",
+        "reused",
+        "thread_id",
+        "start",
+        "duration",
+        "children",
+    )
+
+    def __init__(self, registration: Registration, scope_name: str, reused: bool):
+        self.dependency = describe_dependency(registration.dependency)
+        self.scope = registration.scope.value
+        self.scope_name = scope_name
+        self.reused = reused
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.duration = None
+        self.children = []
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "dependency": self.dependency,
+            "scope": self.scope,
+            "scope_name": self.scope_name,
+            "reused": self.reused,
+            "duration": self.duration,
+            "children": [child.as_dict() for child in self.children],
+        }
+
+
+class Trace:
+    """The tree of dependencies resolved for one top-level request."""
+
+    def __init__(self, root: TraceNode):
+        self.root = root
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self.root.as_dict()
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the trace in the Chrome trace-event format.
+
+        The result can be dumped to a file and opened in chrome://tracing or
+        Perfetto. Every resolve becomes a complete ("X") event.
+        """
+        events = []
+        pid = os.getpid()
+        nodes = [self.root]
+
+        while nodes:
+            node = nodes.pop()
+            events.append(
+                {
+                    "name": node.dependency,
+                    "cat": node.scope,
+                    "ph": "X",
+                    "ts": node.start * 1e6,
+                    "dur": (node.duration or 0.0) * 1e6,
+                    "pid": pid,
+                    "tid": node.thread_id,
+                    "args": {"scope_name": node.scope_name, "reused": node.reused},
+                }
+            )
+            nodes.extend(node.children)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+class Tracer:
+    """Builds a trace for each sampled top-level resolve.
+
+    Finished traces are kept in a bounded buffer, and passed to ``on_trace``
+    when given. The decision to sample is taken once per request, before any
+    bookkeeping, so a trace always holds the complete tree and requests that
+    are not sampled cost next to nothing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sample_rate: float = 1.0,
+        max_traces: int = 100,
+        on_trace: Optional[Callable[[Trace], None]] = None,
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("The sample rate must be between 0 and 1.")
+        self.sample_rate = sample_rate
+        self.on_trace = on_trace
+        self.traces = deque(maxlen=max_traces)
+        self._current = ContextVar(f"dependency_injection_trace_{name}", default=None)
+
+    def is_tracing(self) -> bool:
+        """Return whether the current resolve is traced.
+
+        Outside of a request, this samples whether the request is traced.
+        """
+        current = self._current.get()
+        if current is None:
+            return random.random() < self.sample_rate
+        return current is not _UNSAMPLED
+
+    def is_active(self) -> bool:
+        """Return whether a traced request is in progress."""
+        current = self._current.get()
+        return current is not None and current is not _UNSAMPLED
+
+    def skip(self) -> Optional[Token]:
+        """Mark a new request as untraced, so its nested resolves aren't sampled."""
+        if self._current.get() is None:
+            return self._current.set(_UNSAMPLED)
+        return None
+
+    def reset(self, token: Token) -> None:
+        self._current.reset(token)
+
+    def enter(
+        self, registration: Registration, scope_name: str, cache_hit: bool
+    ) -> Token:
+        parent = self._current.get()
+        node = TraceNode(registration, scope_name, cache_hit)
+        if parent is not None:
+            parent.children.append(node)
+        return self._current.set(node)
+
+    def exit(self, token: Token) -> None:
+        node = self._current.get()
+        self._current.reset(token)
+        node.duration = time.perf_counter() - node.start
+
+        if self._current.get() is None:
+            trace = Trace(node)
+            self.traces.append(trace)
+            if self.on_trace is not None:
+                self.on_trace(trace)
+
+    def get_traces(self) -> List[Trace]:
+        return list(self.traces)
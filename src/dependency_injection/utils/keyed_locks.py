@@ -0,0 +1,17 @@
+import threading
+from typing import Any, Dict
+
+
+class KeyedLocks:
+    """Hands out one re-entrant lock per key, created on first use."""
+
+    def __init__(self):
+        self._locks: Dict[Any, threading.RLock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: Any) -> threading.RLock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, threading.RLock())
+        return lock
@@ -2,9 +2,14 @@ class SingletonMeta(type):
     _instances = {}
 
     def __call__(cls, *args, **kwargs):
-        instance_key = (cls, *args, frozenset(kwargs.items()))
+        # Keyword arguments are rare, so don't build a frozenset without them
+        if kwargs:
+            instance_key = (cls, *args, frozenset(kwargs.items()))
+        else:
+            instance_key = (cls, *args)
 
-        if instance_key not in cls._instances:
+        instance = cls._instances.get(instance_key)
+        if instance is None:
             instance = super().__call__(*args, **kwargs)
             cls._instances[instance_key] = instance
-        return cls._instances[instance_key]
+        return instance
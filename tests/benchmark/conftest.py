@@ -0,0 +1,174 @@
+"""Benchmark fixtures.
+
+The benchmarks use the ``benchmark`` fixture of pytest-benchmark when it is
+installed. Otherwise a compatible, dependency-free fixture is provided so the
+suite can run anywhere, writing the same JSON layout with --benchmark-json.
+"""
+
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import time
+
+import pytest
+
+from dependency_injection.container import DependencyContainer
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    pytest_benchmark = None
+
+
+@pytest.fixture
+def container():
+    container = DependencyContainer.get_instance()
+    yield container
+    DependencyContainer.clear_instances()
+
+
+if pytest_benchmark is None:
+    _results = []
+
+    def pytest_addoption(parser):
+        group = parser.getgroup("benchmark")
+        group.addoption(
+            "--benchmark-json",
+            metavar="PATH",
+            help="Write the benchmark results to a JSON file.",
+        )
+        group.addoption(
+            "--benchmark-min-rounds",
+            type=int,
+            default=5,
+            help="Number of timed rounds per benchmark (default: 5).",
+        )
+        group.addoption(
+            "--benchmark-min-time",
+            type=float,
+            default=0.005,
+            help="Minimum duration of a round in seconds (default: 0.005).",
+        )
+        group.addoption(
+            "--benchmark-disable",
+            action="store_true",
+            help="Call each benchmarked function once, without timing it.",
+        )
+
+    class Benchmark:
+        """Times a function in rounds of calibrated iterations."""
+
+        def __init__(self, node, rounds: int, min_time: float, disabled: bool):
+            self.name = node.name
+            self.fullname = node.nodeid
+            self.params = getattr(getattr(node, "callspec", None), "params", None)
+            self.group = None
+            self.extra_info = {}
+            self.stats = None
+            self._rounds = rounds
+            self._min_time = min_time
+            self._disabled = disabled
+
+        def __call__(self, function, *args, **kwargs):
+            if self._disabled:
+                return function(*args, **kwargs)
+
+            iterations = 1
+            while self._time(function, args, kwargs, iterations) < self._min_time:
+                iterations *= 10
+
+            timings = [
+                self._time(function, args, kwargs, iterations) / iterations
+                for _ in range(self._rounds)
+            ]
+            self.stats = {
+                "min": min(timings),
+                "max": max(timings),
+                "mean": statistics.mean(timings),
+                "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                "median": statistics.median(timings),
+                "rounds": len(timings),
+                "iterations": iterations,
+                "ops": 1 / statistics.mean(timings),
+                "total": sum(timings) * iterations,
+            }
+            return function(*args, **kwargs)
+
+        @staticmethod
+        def _time(function, args, kwargs, iterations: int) -> float:
+            loop = range(iterations)
+            start = time.perf_counter()
+            for _ in loop:
+                function(*args, **kwargs)
+            return time.perf_counter() - start
+
+        def as_dict(self) -> dict:
+            return {
+                "group": self.group,
+                "name": self.name,
+                "fullname": self.fullname,
+                "params": self.params,
+                "stats": self.stats,
+                "extra_info": self.extra_info,
+            }
+
+    @pytest.fixture
+    def benchmark(request):
+        option = request.config.getoption
+        benchmark = Benchmark(
+            request.node,
+            rounds=option("--benchmark-min-rounds"),
+            min_time=option("--benchmark-min-time"),
+            disabled=option("--benchmark-disable"),
+        )
+        yield benchmark
+        if benchmark.stats is not None:
+            _results.append(benchmark)
+
+    def _commit_info() -> dict:
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {"id": commit}
+
+    def pytest_sessionfinish(session):
+        path = session.config.getoption("--benchmark-json")
+        if not path or not _results:
+            return
+
+        report = {
+            "machine_info": {
+                "node": platform.node(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "system": platform.system(),
+                "release": platform.release(),
+                "python_implementation": platform.python_implementation(),
+                "python_version": platform.python_version(),
+            },
+            "commit_info": _commit_info(),
+            "benchmarks": [result.as_dict() for result in _results],
+            "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "version": None,
+        }
+        with open(path, "w") as file:
+            json.dump(report, file, indent=4)
+
+    def pytest_terminal_summary(terminalreporter):
+        if not _results:
+            return
+
+        terminalreporter.section("benchmark (min per call)")
+        width = max(len(result.name) for result in _results)
+        for result in _results:
+            terminalreporter.write_line(
+                f"{result.name:<{width}}  {result.stats['min'] * 1e9:12.1f} ns"
+            )
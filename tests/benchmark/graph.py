@@ -0,0 +1,55 @@
+import inspect
+from typing import Callable, Optional, Type
+
+
+def _node(name: str, child: Optional[Type]) -> Type:
+    if child is None:
+        return type(name, (), {})
+
+    def __init__(self, child: child):
+        self.child = child
+
+    return type(name, (), {"__init__": __init__})
+
+
+def _root(children: list) -> Type:
+    def __init__(self, **kwargs):
+        self.children = list(kwargs.values())
+
+    __init__.__signature__ = inspect.Signature(
+        [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        + [
+            inspect.Parameter(
+                f"child_{index}",
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=child,
+            )
+            for index, child in enumerate(children)
+        ]
+    )
+    return type("Root", (), {"__init__": __init__})
+
+
+def build_graph(
+    register: Callable[[Type], None],
+    depth: int,
+    width: int,
+    register_root: Optional[Callable[[Type], None]] = None,
+) -> Type:
+    """Register a root depending on ``width`` chains of ``depth`` classes.
+
+    Every class of the graph is registered with ``register``, unless another
+    callable is given for the root, and the root is returned.
+    """
+    chains = []
+
+    for column in range(width):
+        node = None
+        for level in range(depth):
+            node = _node(f"Node{column}x{level}", node)
+            register(node)
+        chains.append(node)
+
+    root = _root(chains)
+    (register_root or register)(root)
+    return root
@@ -0,0 +1,61 @@
+import pytest
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.decorator import inject
+
+
+class Settings:
+    pass
+
+
+class Repository:
+    pass
+
+
+class Handler:
+    @classmethod
+    def plain(cls, settings: Settings, repository: Repository):
+        return settings, repository
+
+    @classmethod
+    @inject()
+    def injected(cls, settings: Settings, repository: Repository):
+        return settings, repository
+
+
+@pytest.fixture
+def handler(container):
+    container.register_singleton(Settings)
+    container.register_scoped(Repository)
+    return Handler
+
+
+def test_plain_call(benchmark, handler):
+    settings, repository = Settings(), Repository()
+
+    benchmark.group = "inject"
+    benchmark(handler.plain, settings, repository)
+
+
+def test_inject_resolving_all_arguments(benchmark, handler):
+    handler.injected()
+
+    benchmark.group = "inject"
+    benchmark(handler.injected)
+
+
+def test_inject_with_all_arguments_supplied(benchmark, handler):
+    settings, repository = Settings(), Repository()
+
+    benchmark.group = "inject"
+    benchmark(handler.injected, settings, repository=repository)
+
+
+def test_get_default_instance(benchmark, container):
+    benchmark.group = "get_instance"
+    benchmark(DependencyContainer.get_instance)
+
+
+def test_get_named_instance(benchmark, container):
+    benchmark.group = "get_instance"
+    benchmark(DependencyContainer.get_instance, container.name)
@@ -0,0 +1,47 @@
+import pytest
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.registration import Registration
+from dependency_injection.scope import Scope
+
+COUNT = 1000
+
+PLUGINS = [type(f"Plugin{index}", (), {}) for index in range(COUNT)]
+
+
+@pytest.fixture
+def register(container):
+    def register(register_plugins):
+        DependencyContainer.clear_instances()
+        register_plugins(DependencyContainer.get_instance())
+
+    return register
+
+
+def test_register_one_by_one(benchmark, register):
+    def register_plugins(container):
+        for plugin in PLUGINS:
+            container.register_transient(plugin, tags={"plugin"})
+
+    benchmark.group = "register"
+    benchmark(register, register_plugins)
+
+
+def test_register_in_batch(benchmark, register):
+    def register_plugins(container):
+        with container.batch_registration():
+            for plugin in PLUGINS:
+                container.register_transient(plugin, tags={"plugin"})
+
+    benchmark.group = "register"
+    benchmark(register, register_plugins)
+
+
+def test_register_many(benchmark, register):
+    def register_plugins(container):
+        container.register_many(
+            [Registration(p, p, Scope.TRANSIENT, {"plugin"}) for p in PLUGINS]
+        )
+
+    benchmark.group = "register"
+    benchmark(register, register_plugins)
@@ -0,0 +1,56 @@
+from typing import List
+
+import pytest
+
+from dependency_injection.tags.tagged import Tagged
+
+COUNTS = (1000, 5000)
+
+
+class Plugin:
+    pass
+
+
+class Other:
+    pass
+
+
+def register_plugins(container, count: int, scope: str) -> None:
+    register = getattr(container, f"register_{scope}")
+    for index in range(count):
+        # Half of the registrations carry a second tag
+        tags = {Plugin, Other} if index % 2 else {Plugin}
+        register(type(f"Plugin{index}", (Plugin,), {}), tags=tags)
+
+
+@pytest.mark.parametrize("scope", ("singleton", "transient"))
+@pytest.mark.parametrize("count", COUNTS)
+def test_resolve_all_by_tag(benchmark, container, count, scope):
+    register_plugins(container, count, scope)
+    container.resolve_all(tags={Plugin})
+
+    benchmark.group = "resolve_all"
+    benchmark(container.resolve_all, tags={Plugin})
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_resolve_all_matching_all_tags(benchmark, container, count):
+    register_plugins(container, count, "singleton")
+    container.resolve_all(tags={Plugin, Other}, match_all_tags=True)
+
+    benchmark.group = "resolve_all"
+    benchmark(container.resolve_all, tags={Plugin, Other}, match_all_tags=True)
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_resolve_tagged_list_injection(benchmark, container, count):
+    class Host:
+        def __init__(self, plugins: List[Tagged[Plugin]]):
+            self.plugins = plugins
+
+    register_plugins(container, count, "singleton")
+    container.register_transient(Host)
+    container.resolve(Host)
+
+    benchmark.group = "resolve_all"
+    benchmark(container.resolve, Host)
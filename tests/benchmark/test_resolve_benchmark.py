@@ -0,0 +1,56 @@
+import pytest
+
+from benchmark.graph import build_graph
+from dependency_injection.provider import Provider
+
+DEPTHS = (1, 4, 16)
+WIDTHS = (1, 8)
+SCOPES = ("singleton", "scoped", "transient")
+
+
+def register(container, scope: str):
+    return getattr(container, f"register_{scope}")
+
+
+@pytest.mark.parametrize("compiled", (False, True), ids=("plans", "compiled"))
+@pytest.mark.parametrize("width", WIDTHS, ids=lambda width: f"width{width}")
+@pytest.mark.parametrize("depth", DEPTHS, ids=lambda depth: f"depth{depth}")
+@pytest.mark.parametrize("scope", SCOPES)
+def test_resolve_warm(benchmark, container, scope, depth, width, compiled):
+    root = build_graph(register(container, scope), depth, width)
+    if compiled:
+        container.compile()
+    container.resolve(root, scope_name="request")
+
+    benchmark.group = f"resolve-{scope}"
+    benchmark.extra_info.update(nodes=depth * width + 1)
+    benchmark(container.resolve, root, scope_name="request")
+
+
+@pytest.mark.parametrize("depth", DEPTHS, ids=lambda depth: f"depth{depth}")
+def test_resolve_transient_root_over_singletons(benchmark, container, depth):
+    root = build_graph(
+        container.register_singleton,
+        depth,
+        width=8,
+        register_root=container.register_transient,
+    )
+    container.resolve(root)
+
+    benchmark.group = "resolve-mixed"
+    benchmark(container.resolve, root)
+
+
+@pytest.mark.parametrize("depth", DEPTHS, ids=lambda depth: f"depth{depth}")
+def test_provider_call(benchmark, container, depth):
+    root = build_graph(container.register_transient, depth, width=1)
+
+    class Consumer:
+        def __init__(self, provide: Provider[root]):
+            self.provide = provide
+
+    container.register_transient(Consumer)
+    provide = container.resolve(Consumer).provide
+
+    benchmark.group = "provider"
+    benchmark(provide)
@@ -0,0 +1,55 @@
+import itertools
+
+import pytest
+
+
+class Settings:
+    pass
+
+
+class UnitOfWork:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Repository:
+    def __init__(self, unit_of_work: UnitOfWork):
+        self.unit_of_work = unit_of_work
+
+
+@pytest.fixture
+def registered(container):
+    container.register_singleton(Settings)
+    container.register_scoped(UnitOfWork)
+    container.register_transient(Repository)
+    container.resolve(Settings)
+    return container
+
+
+def test_scope_create_resolve_dispose(benchmark, registered):
+    def churn():
+        with registered.create_scope() as scope:
+            scope.resolve(Repository)
+
+    benchmark.group = "scope-churn"
+    benchmark(churn)
+
+
+def test_named_scopes_resolve_and_dispose(benchmark, registered):
+    names = (f"request_{index}" for index in itertools.count())
+
+    def churn():
+        name = next(names)
+        registered.resolve(Repository, scope_name=name)
+        registered.dispose_scope(name)
+
+    benchmark.group = "scope-churn"
+    benchmark(churn)
+
+
+def test_named_scopes_evicted_by_limit(benchmark, registered):
+    registered.configure_scope_limit(128)
+    names = (f"request_{index}" for index in itertools.count())
+
+    benchmark.group = "scope-churn"
+    benchmark(lambda: registered.resolve(Repository, scope_name=next(names)))
@@ -0,0 +1,215 @@
+from typing import List
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.tags.tagged import Tagged
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Settings:
+    pass
+
+
+class Database:
+    pass
+
+
+class TenantDatabase(Database):
+    pass
+
+
+class Repository:
+    def __init__(self, database: Database, settings: Settings):
+        self.database = database
+        self.settings = settings
+
+
+class Plugin:
+    pass
+
+
+class TestCreateChild(UnitTestCase):
+    def _parent(self):
+        parent = DependencyContainer.get_instance("parent")
+        parent.register_singleton(Settings)
+        parent.register_scoped(Database)
+        parent.register_transient(Repository)
+        return parent
+
+    def test_child_resolves_parent_registrations(self):
+        # arrange
+        parent = self._parent()
+
+        # act
+        child = parent.create_child("tenant")
+        repository = child.resolve(Repository)
+
+        # assert
+        self.assertIsInstance(repository.database, Database)
+        self.assertIs(DependencyContainer.get_instance("tenant"), child)
+
+    def test_child_shares_parent_singletons(self):
+        # arrange
+        parent = self._parent()
+        child_1 = parent.create_child("tenant_1")
+        child_2 = parent.create_child("tenant_2")
+
+        # act
+        settings_1 = child_1.resolve(Settings)
+        settings_2 = child_2.resolve(Settings)
+
+        # assert
+        self.assertIs(settings_1, parent.resolve(Settings))
+        self.assertIs(settings_1, settings_2)
+
+    def test_child_registrations_override_parent_only_in_child(self):
+        # arrange
+        parent = self._parent()
+        child = parent.create_child("tenant")
+
+        # act
+        child.register_scoped(Database, TenantDatabase)
+
+        # assert
+        self.assertIsInstance(child.resolve(Repository).database, TenantDatabase)
+        self.assertNotIsInstance(parent.resolve(Repository).database, TenantDatabase)
+        self.assertRaises(ValueError, child.register_scoped, Database)
+
+    def test_child_sees_parent_registrations_made_later(self):
+        # arrange
+        parent = DependencyContainer.get_instance("parent")
+        child = parent.create_child("tenant")
+        self.assertRaises(KeyError, child.resolve, Settings)
+
+        # act
+        parent.register_singleton(Settings)
+
+        # assert
+        self.assertIs(child.resolve(Settings), parent.resolve(Settings))
+
+    def test_grandchild_inherits_through_child(self):
+        # arrange
+        parent = self._parent()
+        child = parent.create_child("tenant")
+        child.register_scoped(Database, TenantDatabase)
+
+        # act
+        grandchild = child.create_child("tenant_test")
+        repository = grandchild.resolve(Repository)
+
+        # assert
+        self.assertIsInstance(repository.database, TenantDatabase)
+        self.assertIs(repository.settings, parent.resolve(Settings))
+
+    def test_child_resolve_all_combines_parent_and_child_tags(self):
+        # arrange
+        class ParentPlugin(Plugin):
+            pass
+
+        class ChildPlugin(Plugin):
+            pass
+
+        class Host:
+            def __init__(self, plugins: List[Tagged[Plugin]]):
+                self.plugins = plugins
+
+        parent = DependencyContainer.get_instance("parent")
+        parent.register_transient(ParentPlugin, tags={Plugin})
+        child = parent.create_child("tenant")
+        child.register_transient(ChildPlugin, tags={Plugin})
+        child.register_transient(Host)
+
+        # act
+        plugins = child.resolve_all(tags={Plugin})
+        host = child.resolve(Host)
+
+        # assert
+        self.assertEqual(
+            [type(plugin) for plugin in plugins], [ParentPlugin, ChildPlugin]
+        )
+        self.assertEqual(len(host.plugins), 2)
+        self.assertEqual(len(parent.resolve_all(tags={Plugin})), 1)
+
+    def test_compiled_child_shares_parent_singletons(self):
+        # arrange
+        parent = self._parent()
+        parent.compile()
+
+        # act
+        child = parent.create_child("tenant")
+        repository = child.resolve(Repository)
+
+        # assert
+        self.assertIs(repository.settings, parent.resolve(Settings))
+
+    def test_child_validates_against_flattened_registrations(self):
+        # arrange
+        parent = DependencyContainer.get_instance("parent")
+        parent.register_transient(Repository)
+        child = parent.create_child("tenant")
+        child.register_scoped(Database)
+        child.register_instance(Settings, Settings())
+
+        # act + assert
+        child.validate()
+        self.assertRaises(ValueError, parent.validate)
+
+    def test_create_child_with_existing_name_raises(self):
+        # arrange
+        parent = self._parent()
+
+        # act + assert
+        self.assertRaises(ValueError, parent.create_child, "parent")
+
+    def test_child_override_replaces_resolved_parent_singleton(self):
+        # arrange
+        parent = self._parent()
+        child = parent.create_child("tenant")
+        child.resolve(Settings)
+
+        # act
+        child.register_transient(Settings, Plugin)
+
+        # assert
+        self.assertIsInstance(child.resolve(Settings), Plugin)
+        self.assertIsInstance(parent.resolve(Settings), Settings)
+
+    def test_compiled_child_override_replaces_resolved_parent_singleton(self):
+        # arrange
+        parent = self._parent()
+        parent.compile()
+        child = parent.create_child("tenant")
+        child.resolve(Repository)
+
+        # act
+        child.register_transient(Settings, Plugin)
+
+        # assert
+        self.assertIsInstance(child.resolve(Repository).settings, Plugin)
+
+    def test_child_instance_override_survives_parent_registrations(self):
+        # arrange
+        parent = self._parent()
+        child = parent.create_child("tenant")
+        child.resolve(Settings)
+        settings = Settings()
+        child.register_instance(Settings, settings)
+
+        # act
+        parent.register_transient(Plugin)
+
+        # assert
+        self.assertIs(settings, child.resolve(Settings))
+
+    def test_frozen_child_ignores_later_parent_registrations(self):
+        # arrange
+        parent = self._parent()
+        child = parent.create_child("tenant")
+        child.freeze()
+
+        # act
+        parent.register_transient(Plugin)
+
+        # assert
+        self.assertIsInstance(parent.resolve(Plugin), Plugin)
+        self.assertRaises(KeyError, child.resolve, Plugin)
+        self.assertIs(parent.resolve(Settings), child.resolve(Settings))
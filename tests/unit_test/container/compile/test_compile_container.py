@@ -0,0 +1,202 @@
+from typing import List, Optional
+from unittest.mock import patch
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.tags.tagged import Tagged
+from unit_test.unit_test_case import UnitTestCase
+
+
+class TestCompileContainer(UnitTestCase):
+    def test_compiled_transient_graph_is_constructed(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Wheel:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine, wheel: Wheel, color: str):
+                self.engine = engine
+                self.wheel = wheel
+                self.color = color
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Wheel)
+        dependency_container.register_transient(Car, constructor_args={"color": "red"})
+
+        # act
+        dependency_container.compile()
+        car_1 = dependency_container.resolve(Car)
+        car_2 = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(car_1.engine, Engine)
+        self.assertIsInstance(car_1.wheel, Wheel)
+        self.assertEqual(car_1.color, "red")
+        self.assertIsNot(car_1, car_2)
+        self.assertIsNot(car_1.engine, car_2.engine)
+
+    def test_compiled_singleton_and_scoped_lifetimes_are_honoured(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Driver:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine, driver: Driver):
+                self.engine = engine
+                self.driver = driver
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_scoped(Driver)
+        dependency_container.register_transient(Car)
+        dependency_container.compile()
+
+        # act
+        car_1 = dependency_container.resolve(Car, scope_name="scope_1")
+        car_2 = dependency_container.resolve(Car, scope_name="scope_1")
+        car_3 = dependency_container.resolve(Car, scope_name="scope_2")
+
+        # assert
+        self.assertIs(car_1.engine, car_3.engine)
+        self.assertIs(car_1.driver, car_2.driver)
+        self.assertIsNot(car_1.driver, car_3.driver)
+
+    def test_compiled_optional_default_and_tagged_parameters(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Wheel:
+            pass
+
+        class Car:
+            def __init__(
+                self,
+                engine: Optional[Engine],
+                wheels: List[Tagged[Wheel]],
+                seats: int = 4,
+            ):
+                self.engine = engine
+                self.wheels = wheels
+                self.seats = seats
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Wheel, tags={Wheel})
+        dependency_container.register_transient(Car)
+        dependency_container.compile()
+
+        # act
+        car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsNone(car.engine)
+        self.assertEqual(len(car.wheels), 1)
+        self.assertEqual(car.seats, 4)
+
+    def test_compiled_missing_dependency_raises(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car)
+        dependency_container.compile()
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.resolve, Car)
+        self.assertRaises(KeyError, dependency_container.resolve, Engine)
+
+    def test_registrations_after_compile_are_picked_up(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Optional[Engine] = None):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car)
+        dependency_container.compile()
+        self.assertIsNone(dependency_container.resolve(Car).engine)
+
+        # act
+        dependency_container.register_transient(Engine)
+        car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(car.engine, Engine)
+
+    def test_compiled_factory_registration(self):
+        # arrange
+        class Engine:
+            def __init__(self, power: int):
+                self.power = power
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_factory(
+            Engine, lambda power: Engine(power), factory_args={"power": 300}
+        )
+        dependency_container.compile()
+
+        # act
+        engine = dependency_container.resolve(Engine)
+
+        # assert
+        self.assertEqual(engine.power, 300)
+
+    def test_compiled_resolve_bypasses_scope_dispatch(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Car)
+        dependency_container.compile()
+
+        # act
+        with patch.object(dependency_container, "_resolve_by_scope") as dispatch:
+            car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(car.engine, Engine)
+        dispatch.assert_not_called()
+
+    def test_compiled_instance_registration_builds_no_plan(self):
+        # arrange
+        class Config:
+            def __init__(self, items: List[int]):
+                self.items = items
+
+        class Service:
+            def __init__(self, config: Config):
+                self.config = config
+
+        dependency_container = DependencyContainer.get_instance()
+        config = Config([1])
+        dependency_container.register_instance(Config, config)
+        dependency_container.register_transient(Service)
+
+        # act
+        dependency_container.compile()
+        service = dependency_container.resolve(Service)
+
+        # assert
+        self.assertIs(config, dependency_container.resolve(Config))
+        self.assertIs(config, service.config)
+        self.assertNotIn(Config, dependency_container._plans)
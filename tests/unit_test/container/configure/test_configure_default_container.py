@@ -54,3 +54,38 @@ class TestConfigureDefaultContainer(UnitTestCase):
 
         self.assertNotEqual(c1, c1_new)
         self.assertNotEqual(c2, c2_new)
+
+    def test_callable_default_container_name_is_called_on_every_get_instance(self):
+        # arrange
+        names = iter(["first", "second"])
+        DependencyContainer.configure_default_container_name(lambda: next(names))
+
+        # act
+        first = DependencyContainer.get_instance()
+        second = DependencyContainer.get_instance()
+
+        # assert
+        self.assertEqual(first.name, "first")
+        self.assertEqual(second.name, "second")
+
+    def test_get_instance_returns_new_default_container_after_clear_instances(self):
+        # arrange
+        default_container = DependencyContainer.get_instance()
+
+        # act
+        DependencyContainer.clear_instances()
+
+        # assert
+        self.assertIsNot(default_container, DependencyContainer.get_instance())
+
+    def test_get_instance_returns_previous_default_container_when_changed_back(self):
+        # arrange
+        default_container = DependencyContainer.get_instance()
+        DependencyContainer.configure_default_container_name("isolated")
+        DependencyContainer.get_instance()
+
+        # act
+        DependencyContainer.configure_default_container_name("default_container")
+
+        # assert
+        self.assertIs(default_container, DependencyContainer.get_instance())
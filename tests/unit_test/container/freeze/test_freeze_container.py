@@ -0,0 +1,106 @@
+from typing import List
+from unittest.mock import patch
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.tags.tagged import Tagged
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Engine:
+    pass
+
+
+class Wheel:
+    pass
+
+
+class Car:
+    def __init__(self, engine: Engine, wheels: List[Tagged[Wheel]]):
+        self.engine = engine
+        self.wheels = wheels
+
+
+class TestFreezeContainer(UnitTestCase):
+    def _container(self):
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_transient(Wheel, tags={Wheel})
+        dependency_container.register_transient(Car)
+        return dependency_container
+
+    def test_frozen_container_rejects_registrations(self):
+        # arrange
+        class Driver:
+            pass
+
+        dependency_container = self._container()
+
+        # act
+        dependency_container.freeze()
+
+        # assert
+        self.assertTrue(dependency_container.is_frozen())
+        self.assertRaises(ValueError, dependency_container.register_transient, Driver)
+        self.assertRaises(
+            ValueError, dependency_container.register_instance, Driver, Driver()
+        )
+        self.assertRaises(
+            ValueError, dependency_container.register_factory, Driver, Driver
+        )
+        self.assertNotIn(Driver, dependency_container._singleton_instances)
+
+    def test_freeze_rejects_invalid_registrations(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car)
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.freeze)
+        self.assertFalse(dependency_container.is_frozen())
+
+    def test_frozen_container_resolves_without_building_anything(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.freeze()
+
+        # act
+        with (
+            patch.object(dependency_container, "_build_plan") as build_plan,
+            patch.object(dependency_container, "_query_tag_index") as query_tag_index,
+        ):
+            car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(car.engine, Engine)
+        self.assertEqual(len(car.wheels), 1)
+        build_plan.assert_not_called()
+        query_tag_index.assert_not_called()
+
+    def test_frozen_compiled_container_has_every_factory(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.compile()
+
+        # act
+        dependency_container._factories.clear()
+        dependency_container.freeze()
+
+        # assert
+        self.assertEqual(set(dependency_container._factories), {Engine, Wheel, Car})
+
+    def test_freeze_compiled_container_with_instance_registration(self):
+        # arrange
+        class Config:
+            def __init__(self, items: List[int]):
+                self.items = items
+
+        dependency_container = DependencyContainer.get_instance()
+        config = Config([1])
+        dependency_container.register_instance(Config, config)
+        dependency_container.compile()
+
+        # act
+        dependency_container.freeze()
+
+        # assert
+        self.assertIs(config, dependency_container.resolve(Config))
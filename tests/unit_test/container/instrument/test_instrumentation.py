@@ -0,0 +1,159 @@
+import asyncio
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Engine:
+    pass
+
+
+class Driver:
+    pass
+
+
+class Car:
+    def __init__(self, engine: Engine, driver: Driver):
+        self.engine = engine
+        self.driver = driver
+
+
+def qualified_name(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class TestInstrumentation(UnitTestCase):
+    def _container(self):
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_scoped(Driver)
+        dependency_container.register_transient(Car)
+        return dependency_container
+
+    def test_disabled_instrumentation_leaves_resolve_untouched(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_instrumentation()
+
+        # act
+        dependency_container.configure_instrumentation(False)
+
+        # assert
+        self.assertNotIn("resolve", vars(dependency_container))
+        self.assertNotIn("resolve_async", vars(dependency_container))
+        self.assertRaises(ValueError, dependency_container.get_instrumentation_stats)
+
+    def test_counts_hits_and_constructions_per_registration(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_instrumentation()
+
+        # act
+        dependency_container.resolve(Car, scope_name="scope_1")
+        dependency_container.resolve(Car, scope_name="scope_1")
+        dependency_container.resolve(Car, scope_name="scope_2")
+        stats = dependency_container.get_instrumentation_stats()
+
+        # assert
+        registrations = stats["registrations"]
+        car = registrations[qualified_name(Car)]
+        engine = registrations[qualified_name(Engine)]
+        driver = registrations[qualified_name(Driver)]
+        self.assertEqual((car["hits"], car["constructions"]), (0, 3))
+        self.assertEqual((engine["hits"], engine["constructions"]), (2, 1))
+        self.assertEqual((driver["hits"], driver["constructions"]), (1, 2))
+        self.assertEqual(car["scope"], "transient")
+        self.assertGreater(car["construction_time"], 0)
+        self.assertAlmostEqual(stats["singleton_hit_ratio"], 2 / 3)
+        self.assertAlmostEqual(stats["scoped_hit_ratio"], 1 / 3)
+
+    def test_hooks_receive_registration_scope_and_cache_hit(self):
+        # arrange
+        dependency_container = self._container()
+        before, after = [], []
+        dependency_container.add_before_resolve_hook(
+            lambda registration, scope_name, cache_hit: before.append(
+                (registration.dependency, scope_name, cache_hit)
+            )
+        )
+        dependency_container.add_after_resolve_hook(
+            lambda registration, scope_name, cache_hit: after.append(
+                (registration.dependency, scope_name, cache_hit)
+            )
+        )
+
+        # act
+        dependency_container.resolve(Engine, scope_name="scope_1")
+        dependency_container.resolve(Car, scope_name="scope_1")
+
+        # assert
+        self.assertEqual(
+            before,
+            [
+                (Engine, "scope_1", False),
+                (Car, "scope_1", False),
+                (Engine, "scope_1", True),
+                (Driver, "scope_1", False),
+            ],
+        )
+        self.assertEqual(
+            after,
+            [
+                (Engine, "scope_1", False),
+                (Engine, "scope_1", True),
+                (Driver, "scope_1", False),
+                (Car, "scope_1", False),
+            ],
+        )
+
+    def test_compiled_container_is_instrumented(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.compile()
+        dependency_container.configure_instrumentation()
+
+        # act
+        dependency_container.resolve(Car)
+        stats = dependency_container.get_instrumentation_stats()
+
+        # assert
+        self.assertEqual(
+            stats["registrations"][qualified_name(Driver)]["constructions"], 1
+        )
+
+    def test_resolve_async_is_instrumented(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_instrumentation()
+
+        # act
+        asyncio.run(dependency_container.resolve_async(Car))
+        stats = dependency_container.get_instrumentation_stats()
+
+        # assert
+        self.assertEqual(
+            set(stats["registrations"]),
+            {qualified_name(Car), qualified_name(Engine), qualified_name(Driver)},
+        )
+
+    def test_unregistered_dependency_still_raises(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_instrumentation()
+
+        # act + assert
+        self.assertRaises(KeyError, dependency_container.resolve, Engine)
+
+    def test_reset_clears_statistics(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_instrumentation()
+        dependency_container.resolve(Car)
+
+        # act
+        dependency_container.reset_instrumentation_stats()
+
+        # assert
+        self.assertEqual(
+            dependency_container.get_instrumentation_stats()["registrations"], {}
+        )
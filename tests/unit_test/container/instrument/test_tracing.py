@@ -0,0 +1,217 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Engine:
+    pass
+
+
+class Driver:
+    pass
+
+
+class Car:
+    def __init__(self, engine: Engine, driver: Driver):
+        self.engine = engine
+        self.driver = driver
+
+
+def qualified_name(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class TestTracing(UnitTestCase):
+    def _container(self):
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_scoped(Driver)
+        dependency_container.register_transient(Car)
+        return dependency_container
+
+    def test_trace_records_dependency_tree_of_request(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_tracing()
+        dependency_container.resolve(Engine)
+
+        # act
+        dependency_container.resolve(Car, scope_name="request")
+        trace = dependency_container.get_traces()[-1].as_dict()
+
+        # assert
+        self.assertEqual(trace["dependency"], qualified_name(Car))
+        self.assertEqual(trace["scope"], "transient")
+        self.assertEqual(trace["scope_name"], "request")
+        self.assertFalse(trace["reused"])
+        self.assertGreater(trace["duration"], 0)
+        self.assertEqual(
+            [(child["dependency"], child["reused"]) for child in trace["children"]],
+            [(qualified_name(Engine), True), (qualified_name(Driver), False)],
+        )
+
+    def test_each_request_produces_one_trace(self):
+        # arrange
+        dependency_container = self._container()
+        traces = []
+        dependency_container.configure_tracing(max_traces=2, on_trace=traces.append)
+
+        # act
+        for _ in range(3):
+            dependency_container.resolve(Car)
+
+        # assert
+        self.assertEqual(len(traces), 3)
+        self.assertEqual(dependency_container.get_traces(), traces[1:])
+
+    def test_sampling_skips_whole_requests(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_tracing(sample_rate=0.5)
+
+        # act
+        with patch("random.random", side_effect=[0.9, 0.1]):
+            dependency_container.resolve(Car)
+            dependency_container.resolve(Car)
+
+        # assert
+        traces = dependency_container.get_traces()
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(len(traces[0].root.children), 2)
+
+    def test_invalid_sample_rate_raises(self):
+        # arrange
+        dependency_container = self._container()
+
+        # act + assert
+        self.assertRaises(
+            ValueError, dependency_container.configure_tracing, sample_rate=1.5
+        )
+
+    def test_trace_exports_json_and_chrome_trace_events(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_tracing()
+        dependency_container.resolve(Car)
+        trace = dependency_container.get_traces()[0]
+
+        # act
+        exported = json.loads(trace.to_json())
+        chrome = trace.to_chrome_trace()
+
+        # assert
+        self.assertEqual(exported, trace.as_dict())
+        self.assertEqual(len(chrome["traceEvents"]), 3)
+        self.assertTrue(all(e["ph"] == "X" for e in chrome["traceEvents"]))
+        json.dumps(chrome)
+
+    def test_failed_request_does_not_leak_into_next_trace(self):
+        # arrange
+        class Broken:
+            def __init__(self, engine: Engine):
+                raise RuntimeError("broken")
+
+        dependency_container = self._container()
+        dependency_container.register_transient(Broken)
+        dependency_container.configure_tracing()
+
+        # act
+        self.assertRaises(RuntimeError, dependency_container.resolve, Broken)
+        dependency_container.resolve(Car)
+
+        # assert
+        self.assertEqual(
+            dependency_container.get_traces()[-1].root.dependency, qualified_name(Car)
+        )
+
+    def test_concurrent_async_parameters_share_the_parent_node(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_tracing()
+
+        # act
+        asyncio.run(dependency_container.resolve_async(Car))
+
+        # assert
+        (trace,) = dependency_container.get_traces()
+        self.assertEqual(len(trace.root.children), 2)
+
+    def test_disabled_tracing_raises_on_get_traces(self):
+        # arrange
+        dependency_container = self._container()
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.get_traces)
+
+    def test_tracing_does_not_enable_instrumentation(self):
+        # arrange
+        dependency_container = self._container()
+
+        # act
+        dependency_container.configure_tracing()
+
+        # assert
+        self.assertRaises(ValueError, dependency_container.get_instrumentation_stats)
+
+    def test_unsampled_request_is_resolved_by_compiled_factories(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.compile()
+        dependency_container.configure_tracing(sample_rate=0.0)
+
+        # act
+        with (
+            patch.object(dependency_container, "_resolve_instrumented") as instrumented,
+            patch.object(dependency_container, "_resolve_by_scope") as dispatch,
+        ):
+            car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(car.driver, Driver)
+        instrumented.assert_not_called()
+        dispatch.assert_not_called()
+        self.assertEqual(dependency_container.get_traces(), [])
+
+    def test_sampled_request_of_compiled_container_records_whole_tree(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.compile()
+        dependency_container.configure_tracing()
+
+        # act
+        dependency_container.resolve(Car)
+
+        # assert
+        (trace,) = dependency_container.get_traces()
+        self.assertEqual(len(trace.root.children), 2)
+
+    def test_unsampled_request_is_still_instrumented(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_instrumentation()
+        dependency_container.configure_tracing(sample_rate=0.0)
+
+        # act
+        dependency_container.resolve(Car)
+
+        # assert
+        stats = dependency_container.get_instrumentation_stats()["registrations"]
+        self.assertEqual(stats[qualified_name(Car)]["constructions"], 1)
+        self.assertEqual(stats[qualified_name(Engine)]["constructions"], 1)
+        self.assertEqual(dependency_container.get_traces(), [])
+
+    def test_disabling_instrumentation_keeps_tracing(self):
+        # arrange
+        dependency_container = self._container()
+        dependency_container.configure_instrumentation()
+        dependency_container.configure_tracing()
+
+        # act
+        dependency_container.configure_instrumentation(False)
+        dependency_container.resolve(Car)
+
+        # assert
+        self.assertEqual(len(dependency_container.get_traces()), 1)
@@ -52,3 +52,25 @@ class TestObtainContainer(UnitTestCase):
         self.assertNotEqual(
             dependency_container_with_first_name, dependency_container_with_second_name
         )
+
+    def test_obtain_default_instance_by_name_returns_same_container(
+        self,
+    ):
+        # act
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container_by_name = DependencyContainer.get_instance(
+            name=DEFAULT_CONTAINER_NAME
+        )
+
+        # assert
+        self.assertIs(dependency_container, dependency_container_by_name)
+
+    def test_obtain_instance_by_constructing_returns_same_container(
+        self,
+    ):
+        # act
+        dependency_container = DependencyContainer.get_instance(name="second_container")
+        constructed_container = DependencyContainer("second_container")
+
+        # assert
+        self.assertIs(dependency_container, constructed_container)
@@ -0,0 +1,223 @@
+import threading
+
+import pytest
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.registration import Registration
+from dependency_injection.scope import Scope
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Vehicle:
+    pass
+
+
+class Car(Vehicle):
+    pass
+
+
+class Engine:
+    pass
+
+
+class Wheel:
+    pass
+
+
+class TestRegisterMany(UnitTestCase):
+    def test_register_many_registers_every_dependency(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        # act
+        dependency_container.register_many(
+            [
+                Registration(Vehicle, Car, Scope.SINGLETON),
+                Registration(Engine, Engine, Scope.TRANSIENT, tags={"part"}),
+                Registration(Wheel, None, Scope.FACTORY, factory=Wheel),
+            ]
+        )
+
+        # assert
+        self.assertIsInstance(dependency_container.resolve(Vehicle), Car)
+        self.assertIs(
+            dependency_container.resolve(Vehicle), dependency_container.resolve(Vehicle)
+        )
+        self.assertIsInstance(dependency_container.resolve(Wheel), Wheel)
+        self.assertEqual(
+            [Engine], [type(e) for e in dependency_container.resolve_all({"part"})]
+        )
+
+    def test_register_many_reports_all_duplicates_in_one_error(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Vehicle, Car)
+
+        # act
+        with pytest.raises(ValueError) as error:
+            dependency_container.register_many(
+                [
+                    Registration(Vehicle, Car, Scope.TRANSIENT),
+                    Registration(Engine, Engine, Scope.TRANSIENT),
+                    Registration(Engine, Engine, Scope.SINGLETON),
+                ]
+            )
+
+        # assert
+        self.assertIn(str(Vehicle), str(error.value))
+        self.assertIn(str(Engine), str(error.value))
+
+    def test_register_many_registers_nothing_when_there_are_duplicates(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        # act
+        with pytest.raises(ValueError):
+            dependency_container.register_many(
+                [
+                    Registration(Wheel, Wheel, Scope.TRANSIENT),
+                    Registration(Engine, Engine, Scope.TRANSIENT),
+                    Registration(Engine, Engine, Scope.TRANSIENT),
+                ]
+            )
+
+        # assert
+        with pytest.raises(KeyError):
+            dependency_container.resolve(Wheel)
+
+    def test_register_many_fails_when_container_is_frozen(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.freeze()
+
+        # act + assert
+        with pytest.raises(ValueError):
+            dependency_container.register_many(
+                [Registration(Engine, Engine, Scope.TRANSIENT)]
+            )
+
+    def test_batch_registration_adds_registrations_when_block_exits(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        # act
+        with dependency_container.batch_registration():
+            dependency_container.register_transient(Engine)
+            dependency_container.register_scoped(Wheel)
+
+            with pytest.raises(KeyError):
+                dependency_container.resolve(Engine)
+
+        # assert
+        self.assertIsInstance(dependency_container.resolve(Engine), Engine)
+        self.assertIsInstance(dependency_container.resolve(Wheel), Wheel)
+
+    def test_batch_registration_reports_all_duplicates_in_one_error(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Wheel)
+
+        # act
+        with pytest.raises(ValueError) as error:
+            with dependency_container.batch_registration():
+                dependency_container.register_transient(Wheel)
+                dependency_container.register_transient(Engine)
+                dependency_container.register_singleton(Engine)
+
+        # assert
+        self.assertIn(str(Wheel), str(error.value))
+        self.assertIn(str(Engine), str(error.value))
+
+    def test_batch_registration_registers_nothing_when_block_raises(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        vehicle = Car()
+
+        # act
+        with pytest.raises(RuntimeError):
+            with dependency_container.batch_registration():
+                dependency_container.register_instance(Vehicle, vehicle)
+                raise RuntimeError()
+
+        # assert
+        with pytest.raises(KeyError):
+            dependency_container.resolve(Vehicle)
+
+    def test_batch_registration_registers_instances_when_block_exits(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        vehicle = Car()
+
+        # act
+        with dependency_container.batch_registration():
+            dependency_container.register_instance(Vehicle, vehicle)
+
+        # assert
+        self.assertIs(vehicle, dependency_container.resolve(Vehicle))
+
+    def test_nested_batch_registration_is_added_with_outer_batch(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        # act
+        with dependency_container.batch_registration():
+            with dependency_container.batch_registration():
+                dependency_container.register_transient(Engine)
+
+            with pytest.raises(KeyError):
+                dependency_container.resolve(Engine)
+
+        # assert
+        self.assertIsInstance(dependency_container.resolve(Engine), Engine)
+
+    def test_batch_registration_invalidates_resolved_tag_queries(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine, tags={"part"})
+        dependency_container.resolve_all({"part"})
+
+        # act
+        with dependency_container.batch_registration():
+            dependency_container.register_transient(Wheel, tags={"part"})
+
+        # assert
+        self.assertEqual(2, len(dependency_container.resolve_all({"part"})))
+
+    def test_batch_registration_in_child_container_overrides_parent(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Vehicle)
+        child = dependency_container.create_child("child")
+
+        # act
+        with child.batch_registration():
+            child.register_transient(Vehicle, Car)
+            child.register_transient(Engine)
+
+        # assert
+        self.assertIsInstance(child.resolve(Vehicle), Car)
+        self.assertIsInstance(child.resolve(Engine), Engine)
+        self.assertNotIsInstance(dependency_container.resolve(Vehicle), Car)
+
+    def test_batch_registration_does_not_collect_other_threads(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        def register_wheel():
+            dependency_container.register_transient(Wheel)
+
+        # act
+        with pytest.raises(RuntimeError):
+            with dependency_container.batch_registration():
+                dependency_container.register_transient(Engine)
+                thread = threading.Thread(target=register_wheel)
+                thread.start()
+                thread.join()
+
+                self.assertIsInstance(dependency_container.resolve(Wheel), Wheel)
+                raise RuntimeError()
+
+        # assert
+        self.assertIsInstance(dependency_container.resolve(Wheel), Wheel)
+        with pytest.raises(KeyError):
+            dependency_container.resolve(Engine)
@@ -0,0 +1,142 @@
+import copy
+import pickle
+from types import MappingProxyType
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.registration import Registration
+from dependency_injection.scope import Scope
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Vehicle:
+    pass
+
+
+class Car(Vehicle):
+    def __init__(self, color: str = "red"):
+        self.color = color
+
+
+def build_car(color: str) -> Car:
+    return Car(color)
+
+
+class TestRegistration(UnitTestCase):
+    def test_registration_has_no_instance_dict(self):
+        # arrange
+        registration = Registration(Vehicle, Car, Scope.TRANSIENT)
+
+        # act + assert
+        self.assertFalse(hasattr(registration, "__dict__"))
+
+    def test_registration_is_immutable(self):
+        # arrange
+        registration = Registration(Vehicle, Car, Scope.TRANSIENT)
+
+        # act + assert
+        with self.assertRaises(AttributeError):
+            registration.scope = Scope.SINGLETON
+        with self.assertRaises(AttributeError):
+            del registration.tags
+
+    def test_registrations_without_tags_or_args_share_empty_defaults(self):
+        # arrange
+        registration_1 = Registration(Vehicle, Car, Scope.TRANSIENT)
+        registration_2 = Registration(Car, Car, Scope.SCOPED)
+
+        # act + assert
+        self.assertEqual(registration_1.tags, frozenset())
+        self.assertIs(registration_1.tags, registration_2.tags)
+        self.assertIs(registration_1.constructor_args, registration_2.constructor_args)
+        self.assertIs(registration_1.factory_args, registration_2.constructor_args)
+
+    def test_registration_copies_tags_and_args_into_read_only_values(self):
+        # arrange
+        tags = {Vehicle}
+        constructor_args = {"color": "blue"}
+
+        # act
+        registration = Registration(
+            Vehicle, Car, Scope.TRANSIENT, tags, constructor_args
+        )
+        tags.add(Car)
+        constructor_args["color"] = "green"
+
+        # assert
+        self.assertEqual(registration.tags, frozenset({Vehicle}))
+        self.assertIsInstance(registration.constructor_args, MappingProxyType)
+        self.assertEqual(registration.constructor_args, {"color": "blue"})
+
+    def test_container_resolves_with_read_only_args(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(
+            Vehicle, Car, constructor_args={"color": "blue"}
+        )
+        dependency_container.register_factory(
+            Car, lambda color: Car(color), factory_args={"color": "green"}
+        )
+
+        # act
+        vehicle = dependency_container.resolve(Vehicle)
+        car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertEqual(vehicle.color, "blue")
+        self.assertEqual(car.color, "green")
+
+    def _assert_equivalent(self, registration, copied):
+        self.assertIsNot(registration, copied)
+        for name in Registration.__slots__:
+            self.assertEqual(getattr(registration, name), getattr(copied, name))
+        self.assertIsInstance(copied.constructor_args, MappingProxyType)
+        self.assertIsInstance(copied.factory_args, MappingProxyType)
+        with self.assertRaises(AttributeError):
+            copied.scope = Scope.SINGLETON
+
+    def test_registration_can_be_copied(self):
+        # arrange
+        registration = Registration(
+            Vehicle, Car, Scope.TRANSIENT, {"car"}, {"color": "blue"}
+        )
+
+        # act
+        copied = copy.copy(registration)
+
+        # assert
+        self._assert_equivalent(registration, copied)
+
+    def test_registration_can_be_deep_copied(self):
+        # arrange
+        registration = Registration(
+            Car, None, Scope.FACTORY, factory=build_car, factory_args={"color": "red"}
+        )
+
+        # act
+        copied = copy.deepcopy(registration)
+
+        # assert
+        self._assert_equivalent(registration, copied)
+
+    def test_registration_can_be_pickled(self):
+        # arrange
+        registration = Registration(
+            Vehicle, Car, Scope.SINGLETON, {"car"}, {"color": "blue"}
+        )
+
+        # act
+        copied = pickle.loads(pickle.dumps(registration))
+
+        # assert
+        self._assert_equivalent(registration, copied)
+
+    def test_copied_registration_without_tags_or_args_shares_empty_defaults(self):
+        # arrange
+        registration = Registration(Vehicle, Car, Scope.TRANSIENT)
+
+        # act
+        copied = copy.copy(registration)
+
+        # assert
+        self.assertIs(registration.tags, copied.tags)
+        self.assertIs(registration.constructor_args, copied.constructor_args)
@@ -180,3 +180,89 @@ class TestResolveAll(UnitTestCase):
                 for dependency in resolved_dependencies
             )
         )
+
+    def test_returns_dependencies_matching_any_tag_in_registration_order(
+        self,
+    ):
+        # arrange
+        class Driveable:
+            pass
+
+        class Floating:
+            pass
+
+        class Car:
+            pass
+
+        class Boat:
+            pass
+
+        class Amphibian:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car, tags={Driveable})
+        dependency_container.register_transient(Boat, tags={Floating})
+        dependency_container.register_transient(Amphibian, tags={Driveable, Floating})
+
+        # act
+        resolved_dependencies = dependency_container.resolve_all(
+            tags={Floating, Driveable}
+        )
+
+        # assert
+        self.assertEqual(
+            [type(dependency) for dependency in resolved_dependencies],
+            [Car, Boat, Amphibian],
+        )
+
+    def test_returns_dependencies_registered_after_previous_resolve_all(
+        self,
+    ):
+        # arrange
+        class Driveable:
+            pass
+
+        class Car:
+            pass
+
+        class Truck:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car, tags={Driveable})
+        self.assertEqual(len(dependency_container.resolve_all(tags={Driveable})), 1)
+
+        # act
+        dependency_container.register_transient(Truck, tags={Driveable})
+        resolved_dependencies = dependency_container.resolve_all(tags={Driveable})
+
+        # assert
+        self.assertEqual(len(resolved_dependencies), 2)
+        self.assertIsInstance(resolved_dependencies[1], Truck)
+
+    def test_returns_nothing_for_unknown_tag(
+        self,
+    ):
+        # arrange
+        class Driveable:
+            pass
+
+        class Floating:
+            pass
+
+        class Car:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car, tags={Driveable})
+
+        # act
+        any_tagged = dependency_container.resolve_all(tags={Floating})
+        all_tagged = dependency_container.resolve_all(
+            tags={Driveable, Floating}, match_all_tags=True
+        )
+
+        # assert
+        self.assertEqual(any_tagged, [])
+        self.assertEqual(all_tagged, [])
@@ -0,0 +1,267 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.tags.tagged import Tagged
+from unit_test.unit_test_case import UnitTestCase
+
+
+class TestResolveAsync(UnitTestCase):
+    def test_resolve_async_awaits_coroutine_factory(self):
+        # arrange
+        class Connection:
+            pass
+
+        async def connect():
+            await asyncio.sleep(0)
+            return Connection()
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_factory(Connection, connect)
+
+        # act
+        connection = asyncio.run(dependency_container.resolve_async(Connection))
+
+        # assert
+        self.assertIsInstance(connection, Connection)
+
+    def test_resolve_async_injects_async_dependencies_into_constructors(self):
+        # arrange
+        class Connection:
+            pass
+
+        class Repository:
+            def __init__(self, connection: Connection, name: str = "orders"):
+                self.connection = connection
+                self.name = name
+
+        async def connect():
+            return Connection()
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_factory(Connection, connect)
+        dependency_container.register_transient(Repository)
+
+        # act
+        repository = asyncio.run(dependency_container.resolve_async(Repository))
+
+        # assert
+        self.assertIsInstance(repository.connection, Connection)
+        self.assertEqual(repository.name, "orders")
+
+    def test_concurrent_resolves_of_singleton_share_one_construction(self):
+        # arrange
+        constructions = []
+
+        class Connection:
+            pass
+
+        class ConnectionPool:
+            def __init__(self, connection: Connection):
+                constructions.append(self)
+
+        async def connect():
+            await asyncio.sleep(0.01)
+            return Connection()
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_factory(Connection, connect)
+        dependency_container.register_singleton(ConnectionPool)
+
+        async def resolve_many():
+            return await asyncio.gather(
+                *(dependency_container.resolve_async(ConnectionPool) for _ in range(10))
+            )
+
+        # act
+        pools = asyncio.run(resolve_many())
+
+        # assert
+        self.assertEqual(len(constructions), 1)
+        self.assertTrue(all(pool is pools[0] for pool in pools))
+
+    def test_independent_dependencies_are_built_concurrently(self):
+        # arrange
+        started = []
+
+        class Cache:
+            pass
+
+        class Database:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache, database: Database):
+                self.cache = cache
+                self.database = database
+
+        def factory(cls):
+            async def create():
+                started.append(cls)
+                await asyncio.sleep(0)
+                # Both factories have started before either one finishes
+                assert len(started) == 2
+                return cls()
+
+            return create
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_factory(Cache, factory(Cache))
+        dependency_container.register_factory(Database, factory(Database))
+        dependency_container.register_transient(Service)
+
+        # act
+        service = asyncio.run(dependency_container.resolve_async(Service))
+
+        # assert
+        self.assertIsInstance(service.cache, Cache)
+        self.assertIsInstance(service.database, Database)
+
+    def test_resolve_all_async_resolves_tagged_dependencies(self):
+        # arrange
+        class Plugin:
+            pass
+
+        class Host:
+            def __init__(self, plugins: List[Tagged[Plugin]]):
+                self.plugins = plugins
+
+        async def create_plugin():
+            return Plugin()
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_factory(Plugin, create_plugin, tags={Plugin})
+        dependency_container.register_transient(Host)
+
+        # act
+        host = asyncio.run(dependency_container.resolve_async(Host))
+
+        # assert
+        self.assertEqual(len(host.plugins), 1)
+        self.assertIsInstance(host.plugins[0], Plugin)
+
+    def test_async_scope_closes_instances_on_exit(self):
+        # arrange
+        closed = []
+
+        class Session:
+            async def aclose(self):
+                closed.append(self)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Session)
+
+        async def use_scope():
+            async with dependency_container.create_async_scope() as scope:
+                session_1 = await scope.resolve(Session)
+                session_2 = await scope.resolve(Session)
+            return session_1, session_2
+
+        # act
+        session_1, session_2 = asyncio.run(use_scope())
+
+        # assert
+        self.assertIs(session_1, session_2)
+        self.assertEqual(closed, [session_1])
+
+    def test_resolve_async_awaits_async_initialiser_before_injecting(self):
+        # arrange
+        class Connection:
+            def __init__(self):
+                self.open = False
+
+            async def __ainit__(self):
+                await asyncio.sleep(0)
+                self.open = True
+
+        class Repository:
+            def __init__(self, connection: Connection):
+                self.connection_was_open = connection.open
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Connection)
+        dependency_container.register_transient(Repository)
+
+        # act
+        repository = asyncio.run(dependency_container.resolve_async(Repository))
+
+        # assert
+        self.assertTrue(repository.connection_was_open)
+
+    def test_concurrent_resolves_share_one_async_initialisation(self):
+        # arrange
+        initialisations = []
+
+        class Connection:
+            async def __ainit__(self):
+                initialisations.append(self)
+                await asyncio.sleep(0.01)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Connection)
+
+        async def resolve_concurrently():
+            return await asyncio.gather(
+                *(dependency_container.resolve_async(Connection) for _ in range(5))
+            )
+
+        # act
+        connections = asyncio.run(resolve_concurrently())
+
+        # assert
+        self.assertEqual(len(initialisations), 1)
+        self.assertTrue(all(c is connections[0] for c in connections))
+
+    def test_async_resolve_keeps_singleton_resolved_meanwhile(self):
+        # arrange
+        class Connection:
+            async def __ainit__(self):
+                await asyncio.sleep(0)
+
+        class ConnectionPool:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Connection)
+        dependency_container.register_singleton(ConnectionPool)
+
+        async def resolve_mixed():
+            task = asyncio.ensure_future(
+                dependency_container.resolve_async(ConnectionPool)
+            )
+            await asyncio.sleep(0)
+            pool = dependency_container.resolve(ConnectionPool)
+            return pool, await task
+
+        # act
+        pool, async_pool = asyncio.run(resolve_mixed())
+
+        # assert
+        self.assertIs(pool, async_pool)
+        self.assertIs(pool, dependency_container.resolve(ConnectionPool))
+
+    def test_resolve_async_in_event_loops_of_different_threads(self):
+        # arrange
+        class Connection:
+            async def __ainit__(self):
+                await asyncio.sleep(0.01)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_singleton(Connection)
+        barrier = threading.Barrier(2)
+
+        def resolve_in_own_loop(_):
+            barrier.wait()
+            return asyncio.run(dependency_container.resolve_async(Connection))
+
+        # act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            connections = list(executor.map(resolve_in_own_loop, range(2)))
+
+        # assert
+        self.assertIs(connections[0], connections[1])
+        self.assertIs(connections[0], dependency_container.resolve(Connection))
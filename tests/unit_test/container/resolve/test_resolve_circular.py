@@ -0,0 +1,109 @@
+import asyncio
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Egg:
+    pass
+
+
+class Chicken:
+    def __init__(self, egg: Egg):
+        self.egg = egg
+
+
+class ChickenEgg(Egg):
+    def __init__(self, chicken: Chicken):
+        self.chicken = chicken
+
+
+class TestResolveCircular(UnitTestCase):
+    def test_resolve_reports_cycle_path_when_detection_is_enabled(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_cycle_detection()
+        dependency_container.register_transient(Chicken)
+        dependency_container.register_transient(Egg, ChickenEgg)
+
+        # act
+        with self.assertRaises(ValueError) as context:
+            dependency_container.resolve(Chicken)
+
+        # assert
+        self.assertIn(
+            "Circular dependency detected: Chicken -> Egg -> Chicken",
+            str(context.exception),
+        )
+
+    def test_resolve_detects_cycle_through_singletons_in_compiled_mode(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_cycle_detection()
+        dependency_container.register_singleton(Chicken)
+        dependency_container.register_singleton(Egg, ChickenEgg)
+        dependency_container.compile()
+
+        # act + assert
+        with self.assertRaises(ValueError):
+            dependency_container.resolve(Egg)
+
+    def test_resolve_async_reports_cycle_instead_of_waiting_forever(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Chicken)
+        dependency_container.register_singleton(Egg, ChickenEgg)
+
+        # act
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(dependency_container.resolve_async(Chicken))
+
+        # assert
+        self.assertIn("Circular dependency detected", str(context.exception))
+
+    def test_resolve_of_shared_dependency_is_not_a_cycle(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Chassis:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        class Car:
+            def __init__(self, engine: Engine, chassis: Chassis):
+                self.engine = engine
+                self.chassis = chassis
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_cycle_detection()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Chassis)
+        dependency_container.register_transient(Car)
+
+        # act
+        car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(car.chassis.engine, Engine)
+
+    def test_validate_reports_cycle(self):
+        # arrange
+        class Farm:
+            def __init__(self, chicken: Chicken):
+                self.chicken = chicken
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Farm)
+        dependency_container.register_transient(Chicken)
+        dependency_container.register_transient(Egg, ChickenEgg)
+
+        # act
+        with self.assertRaises(ValueError) as context:
+            dependency_container.validate()
+
+        # assert
+        self.assertIn(
+            "Circular dependency detected: Chicken -> Egg -> Chicken",
+            str(context.exception),
+        )
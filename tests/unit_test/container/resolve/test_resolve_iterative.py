@@ -0,0 +1,182 @@
+import threading
+from unittest.mock import patch
+
+from dependency_injection.container import DependencyContainer
+from unit_test.container.resolve.test_resolve_all import TestResolveAll
+from unit_test.container.resolve.test_resolve_circular import (
+    Chicken,
+    ChickenEgg,
+    Egg,
+)
+from unit_test.container.resolve.test_resolve_scoped import TestResolveScoped
+from unit_test.container.resolve.test_resolve_singleton import TestResolveSingleton
+from unit_test.container.resolve.test_resolve_thread_safe import (
+    TestResolveThreadSafe,
+)
+from unit_test.container.resolve.test_resolve_transient import TestResolveTransient
+from unit_test.container.resolve.test_resolve_with_args import TestResolveWithArgs
+from unit_test.container.resolve.test_resolve_with_default_values import (
+    TestResolveWithDefaultValues,
+)
+from unit_test.container.resolve.test_resolve_with_injection import (
+    TestResolveWithInjection,
+)
+from unit_test.container.resolve.test_resolve_with_optionals import (
+    TestResolveWithOptionals,
+)
+from unit_test.unit_test_case import UnitTestCase
+
+DEPTH = 5000
+
+
+class IterativeResolutionMixin:
+    """Runs a resolve test case with iterative resolution enabled."""
+
+    def setUp(self):
+        super().setUp()
+        init = DependencyContainer.__init__
+
+        def iterative_init(container, *args, **kwargs):
+            init(container, *args, **kwargs)
+            container.configure_iterative_resolution()
+
+        patcher = patch.object(DependencyContainer, "__init__", iterative_init)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestResolveTransientIteratively(IterativeResolutionMixin, TestResolveTransient):
+    pass
+
+
+class TestResolveScopedIteratively(IterativeResolutionMixin, TestResolveScoped):
+    pass
+
+
+class TestResolveSingletonIteratively(IterativeResolutionMixin, TestResolveSingleton):
+    pass
+
+
+class TestResolveAllIteratively(IterativeResolutionMixin, TestResolveAll):
+    pass
+
+
+class TestResolveWithArgsIteratively(IterativeResolutionMixin, TestResolveWithArgs):
+    pass
+
+
+class TestResolveWithDefaultValuesIteratively(
+    IterativeResolutionMixin, TestResolveWithDefaultValues
+):
+    pass
+
+
+class TestResolveWithInjectionIteratively(
+    IterativeResolutionMixin, TestResolveWithInjection
+):
+    pass
+
+
+class TestResolveWithOptionalsIteratively(
+    IterativeResolutionMixin, TestResolveWithOptionals
+):
+    pass
+
+
+class TestResolveThreadSafeIteratively(IterativeResolutionMixin, TestResolveThreadSafe):
+    pass
+
+
+class TestResolveIterative(UnitTestCase):
+    def _register_chain(self, dependency_container, register, depth):
+        previous = type("Node0", (), {})
+        register(previous)
+
+        for index in range(1, depth):
+
+            def __init__(self, child: previous):
+                self.child = child
+
+            previous = type(f"Node{index}", (), {"__init__": __init__})
+            register(previous)
+
+        return previous
+
+    def test_deep_transient_chain_does_not_exhaust_the_stack(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_iterative_resolution()
+        root = self._register_chain(
+            dependency_container, dependency_container.register_transient, DEPTH
+        )
+
+        # act
+        node = dependency_container.resolve(root)
+
+        # assert
+        depth = 1
+        while hasattr(node, "child"):
+            node, depth = node.child, depth + 1
+        self.assertEqual(depth, DEPTH)
+
+    def test_deep_singleton_chain_is_cached(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_iterative_resolution()
+        root = self._register_chain(
+            dependency_container, dependency_container.register_singleton, DEPTH
+        )
+
+        # act
+        node = dependency_container.resolve(root)
+
+        # assert
+        self.assertIs(node, dependency_container.resolve(root))
+        self.assertEqual(len(dependency_container._singleton_instances), DEPTH)
+
+    def test_cycle_is_reported_without_enabling_detection(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_iterative_resolution()
+        dependency_container.register_transient(Chicken)
+        dependency_container.register_transient(Egg, ChickenEgg)
+
+        # act
+        with self.assertRaises(ValueError) as context:
+            dependency_container.resolve(Chicken)
+
+        # assert
+        self.assertIn(
+            "Circular dependency detected: Chicken -> Egg -> Chicken",
+            str(context.exception),
+        )
+
+    def test_failed_resolve_leaves_no_partial_singletons(self):
+        # arrange
+        class Engine:
+            def __init__(self):
+                raise RuntimeError("engine failure")
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_iterative_resolution()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_singleton(Car)
+
+        # act
+        self.assertRaises(RuntimeError, dependency_container.resolve, Car)
+
+        # assert
+        self.assertEqual(dependency_container._singleton_instances, {})
+        acquired = []
+        lock = dependency_container._locks.get(Car)
+        thread = threading.Thread(
+            target=lambda: acquired.append(lock.acquire(blocking=False))
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(acquired, [True])
@@ -0,0 +1,165 @@
+import asyncio
+from typing import List
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.lazy import Lazy
+from unit_test.unit_test_case import UnitTestCase
+
+
+class ReportGenerator:
+    instances = 0
+
+    def __init__(self):
+        ReportGenerator.instances += 1
+
+
+class Handler:
+    def __init__(self, reports: Lazy[ReportGenerator]):
+        self.reports = reports
+
+
+class Listener:
+    pass
+
+
+class EventBus:
+    def __init__(self, listener: Lazy[Listener]):
+        self.listener = listener
+
+
+class AuditListener(Listener):
+    def __init__(self, bus: EventBus):
+        self.bus = bus
+
+
+class Settings:
+    def __init__(self, items: List[int]):
+        self.items = items
+
+
+class SettingsConsumer:
+    def __init__(self, settings: Lazy[Settings]):
+        self.settings = settings
+
+
+class TestResolveLazy(UnitTestCase):
+    def setUp(self):
+        ReportGenerator.instances = 0
+
+    def test_lazy_dependency_is_resolved_on_first_access(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(ReportGenerator)
+        dependency_container.register_transient(Handler)
+
+        # act
+        handler = dependency_container.resolve(Handler)
+
+        # assert
+        self.assertIsInstance(handler.reports, Lazy)
+        self.assertFalse(handler.reports.is_resolved)
+        self.assertEqual(ReportGenerator.instances, 0)
+        self.assertIsInstance(handler.reports.value, ReportGenerator)
+        self.assertIs(handler.reports.value, handler.reports.value)
+        self.assertEqual(ReportGenerator.instances, 1)
+
+    def test_lazy_dependency_honours_singleton_scope(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(ReportGenerator)
+        dependency_container.register_transient(Handler)
+
+        # act
+        handler_1 = dependency_container.resolve(Handler)
+        handler_2 = dependency_container.resolve(Handler)
+
+        # assert
+        self.assertIs(handler_1.reports.value, handler_2.reports.value)
+        self.assertIs(
+            handler_1.reports.value, dependency_container.resolve(ReportGenerator)
+        )
+
+    def test_lazy_dependency_resolves_in_scope_of_injection(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(ReportGenerator)
+        dependency_container.register_transient(Handler)
+
+        # act
+        handler = dependency_container.resolve(Handler, scope_name="scope_1")
+
+        # assert
+        self.assertIs(
+            handler.reports.value,
+            dependency_container.resolve(ReportGenerator, scope_name="scope_1"),
+        )
+        self.assertIsNot(
+            handler.reports.value,
+            dependency_container.resolve(ReportGenerator, scope_name="scope_2"),
+        )
+
+    def test_unregistered_lazy_dependency_raises(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Handler)
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.resolve, Handler)
+        self.assertRaises(ValueError, dependency_container.validate)
+
+    def test_lazy_dependency_with_default_falls_back_when_unregistered(self):
+        # arrange
+        class OptionalHandler:
+            def __init__(self, reports: Lazy[ReportGenerator] = None):
+                self.reports = reports
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(OptionalHandler)
+
+        # act
+        handler = dependency_container.resolve(OptionalHandler)
+
+        # assert
+        self.assertIsNone(handler.reports)
+
+    def test_lazy_dependency_breaks_circular_construction(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(EventBus)
+        dependency_container.register_singleton(Listener, AuditListener)
+
+        # act
+        dependency_container.validate()
+        bus = dependency_container.resolve(EventBus)
+
+        # assert
+        self.assertIs(bus.listener.value.bus, bus)
+
+    def test_lazy_dependency_in_compiled_and_async_resolution(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(ReportGenerator)
+        dependency_container.register_transient(Handler)
+        dependency_container.compile()
+
+        # act
+        compiled = dependency_container.resolve(Handler)
+        awaited = asyncio.run(dependency_container.resolve_async(Handler))
+
+        # assert
+        self.assertEqual(ReportGenerator.instances, 0)
+        self.assertIs(compiled.reports.value, awaited.reports.value)
+
+    def test_lazy_registered_instance_returns_the_instance(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        settings = Settings([1])
+        dependency_container.register_instance(Settings, settings)
+        dependency_container.register_transient(SettingsConsumer)
+
+        # act
+        consumer = dependency_container.resolve(SettingsConsumer)
+
+        # assert
+        self.assertIs(settings, consumer.settings.value)
+        self.assertNotIn(Settings, dependency_container._factories)
@@ -0,0 +1,158 @@
+import asyncio
+from typing import List
+from unittest.mock import patch
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.provider import Provider
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Engine:
+    pass
+
+
+class Message:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+
+class Consumer:
+    def __init__(self, messages: Provider[Message]):
+        self.messages = messages
+
+
+class Settings:
+    def __init__(self, items: List[int]):
+        self.items = items
+
+
+class SettingsConsumer:
+    def __init__(self, settings: Provider[Settings]):
+        self.settings = settings
+
+
+class TestResolveProvider(UnitTestCase):
+    def test_provider_creates_transient_on_each_call(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_transient(Message)
+        dependency_container.register_transient(Consumer)
+
+        # act
+        consumer = dependency_container.resolve(Consumer)
+        message_1 = consumer.messages()
+        message_2 = consumer.messages()
+
+        # assert
+        self.assertIsInstance(message_1, Message)
+        self.assertIsNot(message_1, message_2)
+        self.assertIs(message_1.engine, message_2.engine)
+
+    def test_provider_resolves_scoped_in_scope_of_injection(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_scoped(Message)
+        dependency_container.register_transient(Consumer)
+
+        # act
+        consumer = dependency_container.resolve(Consumer, scope_name="scope_1")
+
+        # assert
+        self.assertIs(consumer.messages(), consumer.messages())
+        self.assertIs(
+            consumer.messages(),
+            dependency_container.resolve(Message, scope_name="scope_1"),
+        )
+
+    def test_provider_skips_registry_lookup(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Message)
+        dependency_container.register_transient(Consumer)
+        consumer = dependency_container.resolve(Consumer)
+
+        # act
+        with patch.object(dependency_container, "resolve") as resolve:
+            message = consumer.messages()
+
+        # assert
+        self.assertIsInstance(message, Message)
+        resolve.assert_not_called()
+
+    def test_provider_goes_through_resolve_when_instrumented(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Message)
+        dependency_container.register_transient(Consumer)
+        dependency_container.configure_instrumentation()
+        consumer = dependency_container.resolve(Consumer)
+
+        # act
+        consumer.messages()
+        consumer.messages()
+        stats = dependency_container.get_instrumentation_stats()["registrations"]
+
+        # assert
+        message = f"{Message.__module__}.{Message.__qualname__}"
+        self.assertEqual(stats[message]["constructions"], 2)
+
+    def test_unregistered_provider_dependency_raises(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Consumer)
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.resolve, Consumer)
+        self.assertRaises(ValueError, dependency_container.validate)
+
+    def test_provider_in_compiled_and_async_resolution(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Message)
+        dependency_container.register_transient(Consumer)
+        dependency_container.compile()
+
+        # act
+        compiled = dependency_container.resolve(Consumer)
+        awaited = asyncio.run(dependency_container.resolve_async(Consumer))
+
+        # assert
+        self.assertIsInstance(compiled.messages(), Message)
+        self.assertIsInstance(awaited.messages(), Message)
+
+    def test_provider_of_registered_instance_returns_the_instance(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        settings = Settings([1])
+        dependency_container.register_instance(Settings, settings)
+        dependency_container.register_transient(SettingsConsumer)
+
+        # act
+        consumer = dependency_container.resolve(SettingsConsumer)
+
+        # assert
+        self.assertIs(settings, consumer.settings())
+        self.assertNotIn(Settings, dependency_container._factories)
+
+    def test_provider_keeps_its_scope_from_being_evicted(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Engine)
+        dependency_container.register_transient(Message)
+        dependency_container.register_transient(Consumer)
+        dependency_container.configure_scope_limit(2)
+        consumer = dependency_container.resolve(Consumer, scope_name="x")
+        dependency_container.resolve(Engine, scope_name="y")
+
+        # act
+        engine = consumer.messages().engine
+        dependency_container.resolve(Engine, scope_name="z")
+
+        # assert
+        self.assertEqual(list(dependency_container._scoped_instances), ["x", "z"])
+        self.assertIs(engine, consumer.messages().engine)
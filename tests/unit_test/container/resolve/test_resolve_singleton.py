@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from dependency_injection.container import DependencyContainer
 from unit_test.unit_test_case import UnitTestCase
 
@@ -62,3 +64,22 @@ class TestResolveSingleton(UnitTestCase):
 
         # assert
         self.assertIsInstance(resolved_dependency, Vehicle)
+
+    def test_warm_singleton_skips_scope_evaluation(self):
+        # arrange
+        class Vehicle:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Vehicle)
+        resolved_dependency = dependency_container.resolve(Vehicle)
+
+        # act
+        with patch.object(
+            DependencyContainer, "get_default_scope_name"
+        ) as get_default_scope_name:
+            warm_dependency = dependency_container.resolve(Vehicle)
+
+        # assert
+        self.assertIs(warm_dependency, resolved_dependency)
+        get_default_scope_name.assert_not_called()
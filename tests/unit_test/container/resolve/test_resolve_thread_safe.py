@@ -0,0 +1,151 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+THREADS = 32
+RESOLVES_PER_THREAD = 200
+
+
+class TestResolveThreadSafe(UnitTestCase):
+    def _hammer(self, resolve):
+        barrier = threading.Barrier(THREADS)
+
+        def worker(index):
+            barrier.wait()
+            return [resolve(index) for _ in range(RESOLVES_PER_THREAD)]
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(worker, range(THREADS)))
+
+        return [instance for batch in results for instance in batch]
+
+    def test_singleton_is_constructed_once_under_contention(self):
+        # arrange
+        constructions = []
+
+        class ConnectionPool:
+            def __init__(self):
+                constructions.append(self)
+                time.sleep(0.01)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_singleton(ConnectionPool)
+
+        # act
+        instances = self._hammer(
+            lambda index: dependency_container.resolve(ConnectionPool)
+        )
+
+        # assert
+        self.assertEqual(len(constructions), 1)
+        self.assertTrue(all(instance is constructions[0] for instance in instances))
+
+    def test_scoped_instance_is_constructed_once_per_scope_under_contention(self):
+        # arrange
+        constructions = []
+
+        class UnitOfWork:
+            def __init__(self):
+                constructions.append(self)
+                time.sleep(0.01)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_scoped(UnitOfWork)
+
+        # act
+        instances = self._hammer(
+            lambda index: dependency_container.resolve(
+                UnitOfWork, scope_name=f"scope_{index % 4}"
+            )
+        )
+
+        # assert
+        self.assertEqual(len(constructions), 4)
+        self.assertEqual(len({id(instance) for instance in instances}), 4)
+
+    def test_compiled_singleton_graph_is_constructed_once_under_contention(self):
+        # arrange
+        constructions = []
+
+        class Settings:
+            def __init__(self):
+                constructions.append(self)
+                time.sleep(0.01)
+
+        class ConnectionPool:
+            def __init__(self, settings: Settings):
+                constructions.append(self)
+                self.settings = settings
+
+        class Repository:
+            def __init__(self, pool: ConnectionPool):
+                self.pool = pool
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_singleton(Settings)
+        dependency_container.register_singleton(ConnectionPool)
+        dependency_container.register_transient(Repository)
+        dependency_container.compile()
+
+        # act
+        repositories = self._hammer(
+            lambda index: dependency_container.resolve(Repository)
+        )
+
+        # assert
+        self.assertEqual(len(constructions), 2)
+        self.assertEqual(len({id(repository.pool) for repository in repositories}), 1)
+
+    def test_unrelated_singletons_are_constructed_concurrently(self):
+        # arrange
+        b_started = threading.Event()
+        a_saw_b = []
+
+        class A:
+            def __init__(self):
+                a_saw_b.append(b_started.wait(timeout=5))
+
+        class B:
+            def __init__(self):
+                b_started.set()
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_singleton(A)
+        dependency_container.register_singleton(B)
+
+        # act
+        thread = threading.Thread(target=dependency_container.resolve, args=(A,))
+        thread.start()
+        time.sleep(0.01)
+        dependency_container.resolve(B)
+        thread.join()
+
+        # assert
+        self.assertEqual(a_saw_b, [True])
+
+    def test_nested_resolve_of_same_thread_does_not_deadlock(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_singleton(Car)
+
+        # act
+        car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIs(car.engine, dependency_container.resolve(Engine))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import List
+from unittest.mock import patch
 
 from dependency_injection.container import DependencyContainer
 from dependency_injection.tags.all_tagged import AllTagged
@@ -207,3 +208,85 @@ class TestResolveWithInjection(UnitTestCase):
         # assert
         self.assertIsInstance(resolved_dependency, Application)
         self.assertEqual(len(resolved_dependency.primary_ports), 0)
+
+    def test_resolve_reuses_tagged_list_of_singletons(self):
+        # arrange
+        class Plugin:
+            pass
+
+        class AuditPlugin(Plugin):
+            pass
+
+        class MetricsPlugin(Plugin):
+            pass
+
+        class Handler:
+            def __init__(self, plugins: List[Tagged[Plugin]]):
+                self.plugins = plugins
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(AuditPlugin, tags={Plugin})
+        dependency_container.register_singleton(MetricsPlugin, tags={Plugin})
+        dependency_container.register_transient(Handler)
+        first_handler = dependency_container.resolve(Handler)
+
+        # act
+        with patch.object(
+            dependency_container, "_match_registrations"
+        ) as match_registrations:
+            second_handler = dependency_container.resolve(Handler)
+
+        # assert
+        match_registrations.assert_not_called()
+        self.assertEqual(first_handler.plugins, second_handler.plugins)
+        self.assertIsNot(first_handler.plugins, second_handler.plugins)
+
+    def test_resolve_rebuilds_tagged_list_of_transients(self):
+        # arrange
+        class Plugin:
+            pass
+
+        class AuditPlugin(Plugin):
+            pass
+
+        class Handler:
+            def __init__(self, plugins: List[Tagged[Plugin]]):
+                self.plugins = plugins
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(AuditPlugin, tags={Plugin})
+        dependency_container.register_transient(Handler)
+
+        # act
+        first_handler = dependency_container.resolve(Handler)
+        second_handler = dependency_container.resolve(Handler)
+
+        # assert
+        self.assertIsNot(first_handler.plugins[0], second_handler.plugins[0])
+
+    def test_resolve_refreshes_tagged_list_when_registrations_change(self):
+        # arrange
+        class Plugin:
+            pass
+
+        class AuditPlugin(Plugin):
+            pass
+
+        class MetricsPlugin(Plugin):
+            pass
+
+        class Handler:
+            def __init__(self, plugins: List[Tagged[Plugin]]):
+                self.plugins = plugins
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(AuditPlugin, tags={Plugin})
+        dependency_container.register_transient(Handler)
+        self.assertEqual(len(dependency_container.resolve(Handler).plugins), 1)
+
+        # act
+        dependency_container.register_singleton(MetricsPlugin, tags={Plugin})
+        handler = dependency_container.resolve(Handler)
+
+        # assert
+        self.assertEqual(len(handler.plugins), 2)
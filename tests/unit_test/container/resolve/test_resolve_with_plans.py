@@ -0,0 +1,64 @@
+import inspect
+from unittest.mock import patch
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+
+class TestResolveWithPlans(UnitTestCase):
+    def test_signature_is_inspected_once_per_registration(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Car)
+
+        # act
+        with patch(
+            "dependency_injection.container.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
+            for _ in range(5):
+                dependency_container.resolve(Car)
+
+        # assert
+        self.assertEqual(signature.call_count, 2)
+
+    def test_plans_are_invalidated_when_registrations_change(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car)
+        self.assertRaises(ValueError, dependency_container.resolve, Car)
+
+        # act
+        dependency_container.register_transient(Engine)
+        resolved_car = dependency_container.resolve(Car)
+
+        # assert
+        self.assertIsInstance(resolved_car.engine, Engine)
+
+    def test_invalid_constructor_args_are_reported_on_every_resolve(self):
+        # arrange
+        class Car:
+            def __init__(self, color: str):
+                self.color = color
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car, constructor_args={"colour": "red"})
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.resolve, Car)
+        self.assertRaises(ValueError, dependency_container.resolve, Car)
@@ -0,0 +1,224 @@
+import sys
+import threading
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+
+class TestCreateScope(UnitTestCase):
+    def test_scope_resolves_same_instance_within_scope(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+
+        # act
+        with dependency_container.create_scope("request") as scope:
+            unit_of_work_1 = scope.resolve(UnitOfWork)
+            unit_of_work_2 = dependency_container.resolve(
+                UnitOfWork, scope_name="request"
+            )
+
+        # assert
+        self.assertIs(unit_of_work_1, unit_of_work_2)
+
+    def test_scope_instances_are_dropped_on_exit(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+
+        with dependency_container.create_scope("request") as scope:
+            unit_of_work_1 = scope.resolve(UnitOfWork)
+
+        # act
+        with dependency_container.create_scope("request") as scope:
+            unit_of_work_2 = scope.resolve(UnitOfWork)
+
+        # assert
+        self.assertIsNot(unit_of_work_1, unit_of_work_2)
+        self.assertNotIn("request", dependency_container._scoped_instances)
+
+    def test_scope_instances_are_closed_in_reverse_creation_order(self):
+        # arrange
+        closed = []
+
+        class Connection:
+            def close(self):
+                closed.append(self)
+
+        class Transaction:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                closed.append(self)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Connection)
+        dependency_container.register_scoped(Transaction)
+
+        # act
+        with dependency_container.create_scope() as scope:
+            transaction = scope.resolve(Transaction)
+
+        # assert
+        self.assertEqual(closed, [transaction, transaction.connection])
+
+    def test_scope_name_is_generated_when_omitted(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        # act
+        scope_1 = dependency_container.create_scope()
+        scope_2 = dependency_container.create_scope()
+
+        # assert
+        self.assertNotEqual(scope_1.name, scope_2.name)
+
+    def test_scope_limit_disposes_least_recently_used_scope(self):
+        # arrange
+        closed = []
+
+        class UnitOfWork:
+            def close(self):
+                closed.append(self)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+        dependency_container.configure_scope_limit(2)
+
+        first = dependency_container.resolve(UnitOfWork, scope_name="first")
+        dependency_container.resolve(UnitOfWork, scope_name="second")
+        dependency_container.resolve(UnitOfWork, scope_name="first")
+
+        # act
+        dependency_container.resolve(UnitOfWork, scope_name="third")
+
+        # assert
+        self.assertEqual(len(closed), 1)
+        self.assertIsNot(closed[0], first)
+        self.assertEqual(
+            list(dependency_container._scoped_instances), ["first", "third"]
+        )
+
+    def test_scope_limit_warns_instead_of_raising_close_errors(self):
+        # arrange
+        class Connection:
+            def close(self):
+                raise RuntimeError("close failed")
+
+        class Session:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Connection)
+        dependency_container.register_scoped(Session)
+        dependency_container.configure_scope_limit(1)
+        dependency_container.resolve(Connection, scope_name="first")
+
+        # act
+        with self.assertWarns(RuntimeWarning) as warning:
+            session = dependency_container.resolve(Session, scope_name="second")
+
+        # assert
+        self.assertIsInstance(session, Session)
+        self.assertIn("close failed", str(warning.warning))
+        self.assertEqual(list(dependency_container._scoped_instances), ["second"])
+
+    def test_scope_limit_does_not_evict_entered_scopes(self):
+        # arrange
+        closed = []
+
+        class Connection:
+            def close(self):
+                closed.append(self)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Connection)
+        dependency_container.configure_scope_limit(2)
+
+        # act
+        with dependency_container.create_scope("a") as a:
+            connection = a.resolve(Connection)
+            with dependency_container.create_scope("b") as b:
+                b.resolve(Connection)
+                with dependency_container.create_scope("c") as c:
+                    c.resolve(Connection)
+            connection_again = a.resolve(Connection)
+            closed_while_entered = list(closed)
+
+        # assert
+        self.assertNotIn(connection, closed_while_entered)
+        self.assertIs(connection, connection_again)
+        self.assertIn(connection, closed)
+
+    def test_scope_limit_evicts_scopes_that_are_not_entered(self):
+        # arrange
+        class Connection:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Connection)
+        dependency_container.configure_scope_limit(2)
+
+        # act
+        with dependency_container.create_scope("entered") as scope:
+            scope.resolve(Connection)
+            dependency_container.resolve(Connection, scope_name="first")
+            dependency_container.resolve(Connection, scope_name="second")
+
+            # assert
+            self.assertEqual(
+                list(dependency_container._scoped_instances), ["entered", "second"]
+            )
+
+    def test_scope_limit_under_concurrent_resolves(self):
+        # arrange
+        class Connection:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(Connection)
+        dependency_container.configure_scope_limit(2)
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def worker():
+            barrier.wait()
+            try:
+                for index in range(300):
+                    dependency_container.resolve(
+                        Connection, scope_name=f"scope_{index % 4}"
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            # act
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        # assert
+        self.assertEqual(errors, [])
+
+    def test_scope_limit_must_be_positive(self):
+        # arrange
+        dependency_container = DependencyContainer.get_instance()
+
+        # act + assert
+        self.assertRaises(ValueError, dependency_container.configure_scope_limit, 0)
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.decorator import inject
+from dependency_injection.scope import DEFAULT_SCOPE_NAME
+from unit_test.unit_test_case import UnitTestCase
+
+
+class TestCurrentScope(UnitTestCase):
+    def tearDown(self):
+        super().tearDown()
+        DependencyContainer.configure_default_scope_name(DEFAULT_SCOPE_NAME)
+
+    def test_resolve_uses_entered_scope(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+        outside = dependency_container.resolve(UnitOfWork)
+
+        # act
+        with dependency_container.create_scope("request") as scope:
+            inside = dependency_container.resolve(UnitOfWork)
+            current_scope_name = dependency_container.get_current_scope_name()
+            scoped = scope.resolve(UnitOfWork)
+
+        # assert
+        self.assertEqual(current_scope_name, "request")
+        self.assertIs(inside, scoped)
+        self.assertIsNot(inside, outside)
+        self.assertIs(dependency_container.resolve(UnitOfWork), outside)
+
+    def test_default_scope_callable_is_not_called_inside_scope(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        default_scope_name = Mock(return_value="fallback")
+        DependencyContainer.configure_default_scope_name(default_scope_name)
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+
+        # act
+        with dependency_container.create_scope("request"):
+            dependency_container.resolve(UnitOfWork)
+
+        # assert
+        default_scope_name.assert_not_called()
+
+    def test_default_scope_callable_is_used_outside_scope(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        DependencyContainer.configure_default_scope_name(lambda: "fallback")
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+
+        # act
+        resolved = dependency_container.resolve(UnitOfWork)
+
+        # assert
+        self.assertIs(
+            resolved, dependency_container.resolve(UnitOfWork, scope_name="fallback")
+        )
+
+    def test_scopes_are_isolated_between_threads(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.configure_thread_safety()
+        dependency_container.register_scoped(UnitOfWork)
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def worker(name):
+            with dependency_container.create_scope(name):
+                barrier.wait()
+                results[name] = dependency_container.resolve(UnitOfWork)
+                barrier.wait()
+
+        # act
+        threads = [threading.Thread(target=worker, args=(n,)) for n in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # assert
+        self.assertIsNot(results["a"], results["b"])
+
+    def test_scopes_are_isolated_between_tasks(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+
+        async def handle_request():
+            async with dependency_container.create_async_scope():
+                first = dependency_container.resolve(UnitOfWork)
+                await asyncio.sleep(0)
+                second = await dependency_container.resolve_async(UnitOfWork)
+                return first, second
+
+        async def handle_requests():
+            return await asyncio.gather(handle_request(), handle_request())
+
+        # act
+        (first_a, second_a), (first_b, second_b) = asyncio.run(handle_requests())
+
+        # assert
+        self.assertIs(first_a, second_a)
+        self.assertIs(first_b, second_b)
+        self.assertIsNot(first_a, first_b)
+
+    def test_inject_uses_entered_scope(self):
+        # arrange
+        class UnitOfWork:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_scoped(UnitOfWork)
+
+        class Handler:
+            @staticmethod
+            @inject()
+            def handle(unit_of_work: UnitOfWork):
+                return unit_of_work
+
+        # act
+        with dependency_container.create_scope("request") as scope:
+            injected = Handler.handle()
+            resolved = scope.resolve(UnitOfWork)
+
+        # assert
+        self.assertIs(injected, resolved)
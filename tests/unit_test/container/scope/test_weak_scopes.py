@@ -0,0 +1,192 @@
+import asyncio
+import gc
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from dependency_injection.container import DependencyContainer
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Connection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class UnitOfWork:
+    def __init__(self, connection: Connection):
+        self.connection = connection
+
+
+class SlottedUnitOfWork:
+    __slots__ = ()
+
+
+THREADS = 8
+ROUNDS = 300
+
+
+class TestWeakScopes(UnitTestCase):
+    def setUp(self):
+        self.dependency_container = DependencyContainer.get_instance()
+        self.dependency_container.register_scoped(Connection)
+        self.dependency_container.register_scoped(UnitOfWork)
+
+    def _assert_collected_when_unreferenced(self):
+        # act
+        unit_of_work = self.dependency_container.resolve(UnitOfWork)
+        reference = weakref.ref(unit_of_work)
+        del unit_of_work
+        gc.collect()
+
+        # assert
+        self.assertIsNone(reference())
+        self.assertIsNotNone(self.dependency_container.resolve(UnitOfWork))
+
+    def test_scoped_instances_are_kept_without_weak_scopes(self):
+        # arrange
+        reference = weakref.ref(self.dependency_container.resolve(UnitOfWork))
+
+        # act
+        gc.collect()
+
+        # assert
+        self.assertIsNotNone(reference())
+
+    def test_referenced_scoped_instance_is_shared(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+
+        # act
+        unit_of_work_1 = self.dependency_container.resolve(UnitOfWork)
+        unit_of_work_2 = self.dependency_container.resolve(UnitOfWork)
+
+        # assert
+        self.assertIs(unit_of_work_1, unit_of_work_2)
+
+    def test_unreferenced_scoped_instance_is_collected(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+
+        # act + assert
+        self._assert_collected_when_unreferenced()
+
+    def test_unreferenced_scoped_instance_is_collected_when_compiled(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        self.dependency_container.compile()
+
+        # act + assert
+        self._assert_collected_when_unreferenced()
+
+    def test_unreferenced_scoped_instance_is_collected_when_thread_safe(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        self.dependency_container.configure_thread_safety()
+
+        # act + assert
+        self._assert_collected_when_unreferenced()
+
+    def test_unreferenced_scoped_instance_is_collected_when_iterative(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        self.dependency_container.configure_iterative_resolution()
+
+        # act + assert
+        self._assert_collected_when_unreferenced()
+
+    def test_unreferenced_scoped_instance_is_collected_when_resolved_async(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+
+        # act
+        unit_of_work = asyncio.run(self.dependency_container.resolve_async(UnitOfWork))
+        reference = weakref.ref(unit_of_work)
+        del unit_of_work
+        gc.collect()
+
+        # assert
+        self.assertIsNone(reference())
+
+    def test_dependency_is_kept_while_its_dependent_is_referenced(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        unit_of_work = self.dependency_container.resolve(UnitOfWork)
+
+        # act
+        gc.collect()
+        connection = self.dependency_container.resolve(Connection)
+
+        # assert
+        self.assertIs(unit_of_work.connection, connection)
+
+    def test_dispose_scope_closes_referenced_instances(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+
+        # act
+        with self.dependency_container.create_scope() as scope:
+            unit_of_work = scope.resolve(UnitOfWork)
+
+        # assert
+        self.assertTrue(unit_of_work.connection.closed)
+
+    def test_weak_scopes_apply_to_scopes_opened_afterwards(self):
+        # arrange
+        reference = weakref.ref(self.dependency_container.resolve(UnitOfWork))
+        self.dependency_container.configure_weak_scopes()
+
+        # act
+        gc.collect()
+
+        # assert
+        self.assertIsNotNone(reference())
+
+    def test_child_container_inherits_weak_scopes(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        child = self.dependency_container.create_child("child")
+
+        # act
+        reference = weakref.ref(child.resolve(UnitOfWork))
+        gc.collect()
+
+        # assert
+        self.assertIsNone(reference())
+
+    def test_scoped_implementation_without_weak_references_raises(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        self.dependency_container.register_scoped(SlottedUnitOfWork)
+
+        # act + assert
+        with self.assertRaises(TypeError):
+            self.dependency_container.resolve(SlottedUnitOfWork)
+
+    def test_new_scope_is_opened_once_under_contention(self):
+        # arrange
+        self.dependency_container.configure_weak_scopes()
+        self.dependency_container.configure_thread_safety()
+        barrier = threading.Barrier(THREADS)
+
+        def worker(scope_name):
+            barrier.wait()
+            return self.dependency_container.resolve(UnitOfWork, scope_name)
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                for index in range(ROUNDS):
+                    # act
+                    scope_name = f"round_{index}"
+                    units_of_work = list(executor.map(worker, [scope_name] * THREADS))
+
+                    # assert
+                    self.assertEqual(1, len({id(u) for u in units_of_work}))
+        finally:
+            sys.setswitchinterval(switch_interval)
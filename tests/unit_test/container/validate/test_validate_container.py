@@ -0,0 +1,102 @@
+from typing import List, Optional
+
+from dependency_injection.container import DependencyContainer
+from dependency_injection.tags.tagged import Tagged
+from unit_test.unit_test_case import UnitTestCase
+
+
+class TestValidateContainer(UnitTestCase):
+    def test_validate_passes_for_resolvable_registrations(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Wheel:
+            pass
+
+        class Car:
+            def __init__(
+                self,
+                engine: Engine,
+                wheels: List[Tagged[Wheel]],
+                spoiler: Optional[str],
+                color: str = "red",
+            ):
+                pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(Engine)
+        dependency_container.register_transient(Wheel, tags={Wheel})
+        dependency_container.register_transient(Car)
+        dependency_container.register_instance(str, "instance")
+
+        # act + assert
+        dependency_container.validate()
+
+    def test_validate_reports_all_problems_at_once(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                pass
+
+        class Truck:
+            def __init__(self, payload: int):
+                pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Car)
+        dependency_container.register_transient(Truck, constructor_args={"cargo": 1000})
+
+        # act
+        with self.assertRaises(ValueError) as context:
+            dependency_container.validate()
+
+        # assert
+        message = str(context.exception)
+        self.assertIn("parameter 'engine'", message)
+        self.assertIn("constructor argument 'cargo'", message)
+
+    def test_build_caches_resolution_plans(self):
+        # arrange
+        class Engine:
+            pass
+
+        class Car:
+            def __init__(self, engine: Engine):
+                self.engine = engine
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Engine)
+        dependency_container.register_transient(Car)
+
+        # act
+        dependency_container.build()
+
+        # assert
+        self.assertEqual(set(dependency_container._plans), {Engine, Car})
+
+    def test_build_optionally_instantiates_singletons(self):
+        # arrange
+        constructions = []
+
+        class ConnectionPool:
+            def __init__(self):
+                constructions.append(self)
+
+        class Repository:
+            def __init__(self):
+                constructions.append(self)
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_singleton(ConnectionPool)
+        dependency_container.register_transient(Repository)
+
+        # act
+        dependency_container.build(instantiate_singletons=True)
+
+        # assert
+        self.assertEqual(len(constructions), 1)
+        self.assertIs(dependency_container.resolve(ConnectionPool), constructions[0])
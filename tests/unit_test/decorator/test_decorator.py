@@ -1,3 +1,6 @@
+import inspect
+from unittest.mock import patch
+
 import pytest
 
 from dependency_injection.container import DependencyContainer
@@ -250,3 +253,100 @@ class TestDecorator(UnitTestCase):
         self.assertEqual(first_scope_vehicle, Garage.first_vehicle)
         self.assertEqual(second_scope_vehicle, Garage.second_vehicle)
         self.assertNotEqual(Garage.first_vehicle, Garage.second_vehicle)
+
+    def test_positional_arguments_are_not_injected(
+        self,
+    ):
+        # arrange
+        class Vehicle:
+            pass
+
+        class Car(Vehicle):
+            pass
+
+        class Driver:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Vehicle, Car)
+        dependency_container.register_transient(Driver)
+        own_vehicle = Car()
+
+        class Garage:
+            @staticmethod
+            @inject()
+            def park(vehicle: Vehicle, driver: Driver):
+                return vehicle, driver
+
+        # act
+        vehicle, driver = Garage.park(own_vehicle)
+
+        # assert
+        self.assertIs(vehicle, own_vehicle)
+        self.assertIsInstance(driver, Driver)
+
+    def test_signature_is_inspected_and_container_obtained_once(
+        self,
+    ):
+        # arrange
+        class Vehicle:
+            pass
+
+        class Driver:
+            pass
+
+        dependency_container = DependencyContainer.get_instance()
+        dependency_container.register_transient(Vehicle)
+        dependency_container.register_transient(Driver)
+        dependency_container.resolve(Vehicle)
+        dependency_container.resolve(Driver)
+
+        with patch(
+            "dependency_injection.decorator.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
+
+            class Garage:
+                @classmethod
+                @inject()
+                def park(cls, vehicle: Vehicle, driver: Driver):
+                    return vehicle, driver
+
+            # act
+            with patch.object(
+                DependencyContainer,
+                "get_instance",
+                wraps=DependencyContainer.get_instance,
+            ) as get_instance:
+                Garage.park()
+                Garage.park()
+
+        # assert
+        self.assertEqual(signature.call_count, 1)
+        self.assertEqual(get_instance.call_count, 2)
+
+    def test_configured_default_container_is_honoured(
+        self,
+    ):
+        # arrange
+        class Vehicle:
+            pass
+
+        isolated_container = DependencyContainer.get_instance("isolated")
+        isolated_container.register_singleton(Vehicle)
+
+        class Garage:
+            @staticmethod
+            @inject()
+            def park(vehicle: Vehicle):
+                return vehicle
+
+        # act
+        DependencyContainer.configure_default_container_name("isolated")
+        try:
+            vehicle = Garage.park()
+        finally:
+            DependencyContainer.configure_default_container_name("default_container")
+
+        # assert
+        self.assertIs(vehicle, isolated_container.resolve(Vehicle))
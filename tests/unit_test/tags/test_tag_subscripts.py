@@ -0,0 +1,63 @@
+from typing import List
+
+from dependency_injection.tags.all_tagged import AllTagged
+from dependency_injection.tags.any_tagged import AnyTagged
+from dependency_injection.tags.tagged import Tagged
+from unit_test.unit_test_case import UnitTestCase
+
+
+class Driveable:
+    pass
+
+
+class Floating:
+    pass
+
+
+class TestTagSubscripts(UnitTestCase):
+    def test_tagged_subscripts_are_interned(self):
+        # act
+        first = Tagged[Driveable]
+        second = Tagged[Driveable]
+
+        # assert
+        self.assertIs(first, second)
+        self.assertIs(first.tag, Driveable)
+        self.assertIsNot(Tagged[Driveable], Tagged[Floating])
+
+    def test_any_tagged_subscripts_are_interned_regardless_of_order(self):
+        # act
+        first = AnyTagged[Driveable, Floating]
+        second = AnyTagged[Floating, Driveable]
+
+        # assert
+        self.assertIs(first, second)
+        self.assertEqual(first.tags, {Driveable, Floating})
+
+    def test_all_tagged_subscripts_are_interned_regardless_of_order(self):
+        # act
+        first = AllTagged[Driveable, Floating]
+        second = AllTagged[(Floating, Driveable)]
+
+        # assert
+        self.assertIs(first, second)
+        self.assertEqual(first.tags, {Driveable, Floating})
+
+    def test_any_and_all_tagged_subscripts_are_distinct(self):
+        # act
+        any_tagged = AnyTagged[Driveable]
+        all_tagged = AllTagged[Driveable]
+
+        # assert
+        self.assertIsNot(any_tagged, all_tagged)
+        self.assertTrue(issubclass(any_tagged, AnyTagged))
+        self.assertTrue(issubclass(all_tagged, AllTagged))
+
+    def test_list_annotations_with_same_subscript_are_equal(self):
+        # act
+        first = List[Tagged[Driveable]]
+        second = List[Tagged[Driveable]]
+
+        # assert
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))